@@ -1,4 +1,4 @@
 @echo off
 call activate_environment.bat
-call pyinstaller --name CoverflowVideoGenerator --onefile --windowed --copy-metadata imageio --copy-metadata imageio-ffmpeg --collect-data imageio_ffmpeg gui.py
+call pyinstaller --name CoverflowVideoGenerator --onefile --windowed --copy-metadata imageio-ffmpeg --collect-data imageio_ffmpeg gui.py
 pause
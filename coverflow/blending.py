@@ -0,0 +1,83 @@
+"""Alpha blending kernels for compositing tiles onto the canvas.
+
+Uses a Numba-compiled kernel when numba is installed, otherwise NumPy.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+
+    # nogil instead of parallel=True: frames are already rendered on several
+    # threads, and Numba's default parallel backend must not be entered
+    # concurrently from multiple threads.
+    @njit(nogil=True, fastmath=True, cache=True, boundscheck=False)
+    def _blend_bgra_over_bgr_kernel(dst: np.ndarray, src: np.ndarray) -> None:
+        """Blend src (BGRA) over dst (BGR) in place, one pass per pixel."""
+        h, w = src.shape[0], src.shape[1]
+        for y in range(h):
+            for x in range(w):
+                a = np.int32(src[y, x, 3])
+                # Transparent and opaque pixels (most of a tile) skip the math
+                if a == 0:
+                    continue
+                if a == 255:
+                    for c in range(3):
+                        dst[y, x, c] = src[y, x, c]
+                    continue
+                inv = 255 - a
+                for c in range(3):
+                    dst[y, x, c] = (np.int32(src[y, x, c]) * a + np.int32(dst[y, x, c]) * inv + 127) // 255
+
+
+def blend_bgra_over_bgr(dst: np.ndarray, src: np.ndarray) -> None:
+    """Alpha-blend a BGRA image over a BGR region in place.
+
+    Args:
+        dst: BGR canvas region to blend into (modified in place).
+        src: BGRA image with the same height and width as dst.
+    """
+    if NUMBA_AVAILABLE:
+        _blend_bgra_over_bgr_kernel(dst, src)
+        return
+
+    # Fully transparent or fully opaque regions (common for tiles that are
+    # not warped) need no per-pixel math
+    alpha_channel = src[:, :, 3]
+    if not alpha_channel.any():
+        return
+    if (alpha_channel == 255).all():
+        dst[:] = src[:, :, :3]
+        return
+
+    # Same rounded integer math as the kernel, kept in uint16 (the sum peaks
+    # at 255 * 255 + 127); (t + 1 + (t >> 8)) >> 8 == t // 255 in that range
+    alpha = src[:, :, 3:4].astype(np.uint16)
+    t = src[:, :, :3] * alpha
+    t += dst * (255 - alpha)
+    t += 127
+    dst[:] = (t + 1 + (t >> 8)) >> 8
+
+
+def warm_up() -> None:
+    """Compile the blend kernel up front so the first frame is not delayed.
+
+    Canvas regions are strided views unless a tile spans the full canvas
+    width, and tiles may be views or contiguous arrays, so every layout
+    combination used while rendering is compiled.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+
+    dst = np.zeros((2, 2, 3), dtype=np.uint8)
+    src = np.zeros((2, 2, 4), dtype=np.uint8)
+    for dst_region in (dst[:, :1], dst):
+        for src_region in (src[:, :1], src):
+            _blend_bgra_over_bgr_kernel(dst_region, src_region)
@@ -1,6 +1,6 @@
 """Configuration dataclass for coverflow video generation."""
 
-from dataclasses import asdict, dataclass, fields
+from dataclasses import dataclass, fields
 from typing import Any, Dict, Optional
 
 
@@ -29,6 +29,9 @@ class Config:
     side_scale_start: int = 1  # Position where scale effect begins
     side_blur_start: int = 1  # Position where blur effect begins
     side_alpha_start: int = 1  # Position where alpha effect begins
+    fast_blur: bool = False  # Approximate side blur with 3 box filter passes (faster for large blur)
+    fast_warp: bool = False  # Nearest-neighbor warp for heavily faded or blurred side images
+    use_opencl: bool = False  # Transform tiles with OpenCV's OpenCL (T-API) path when available
     visible_range: int = 3  # Number of images visible on each side
     spacing: float = 0.35  # Horizontal spacing between images (lower = closer together)
     reflection: float = 0.2  # Reflection opacity (0 = no reflection, 1 = full opacity)
@@ -47,14 +50,15 @@ class Config:
     end_frame: Optional[int] = None  # Frame to stop rendering at (inclusive)
 
     # Encoding options
-    encoder: str = "h264"  # h264 or h265
+    encoder: str = "h264"  # h264, h265, or auto (hardware H.264 if available)
     crf: int = 23  # 0-51, lower = better quality, larger file
     preset: str = "medium"  # ultrafast, fast, medium, slow, veryslow
     max_bitrate: Optional[str] = None  # e.g. "10M" - caps bitrate for constrained quality
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert config to dictionary for serialization."""
-        return asdict(self)
+        # All fields are primitives, so a shallow copy matches asdict()
+        return dict(self.__dict__)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Config":
@@ -68,5 +72,7 @@ class Config:
         """
         # Only use fields that exist in the dataclass
         valid_fields = {f.name for f in fields(cls)}
+        if data.keys() == valid_fields:
+            return cls(**data)
         filtered = {k: v for k, v in data.items() if k in valid_fields}
         return cls(**filtered)
@@ -0,0 +1,252 @@
+"""Video writer that pipes raw frames straight into an ffmpeg process."""
+
+import os
+import subprocess
+import sys
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+import cv2
+import numpy as np
+from imageio_ffmpeg import get_ffmpeg_exe
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# Linux fcntl command to resize a pipe (not exposed by fcntl before Python 3.10)
+_F_SETPIPE_SZ = getattr(fcntl, "F_SETPIPE_SZ", 1031)
+_PAGE_SIZE = 4096
+
+# Hardware H.264 encoders tried by encoder="auto", in order of preference
+_AUTO_CODECS = ("h264_nvenc", "h264_qsv", "h264_amf", "h264_videotoolbox")
+
+# x264 preset names mapped to NVENC's p1 (fastest) to p7 (best quality)
+_NVENC_PRESETS = {
+    "ultrafast": "p1", "superfast": "p1", "veryfast": "p2", "faster": "p3",
+    "fast": "p3", "medium": "p4", "slow": "p5", "slower": "p6", "veryslow": "p7",
+}
+
+
+def _startupinfo():
+    """Get Popen startupinfo that keeps ffmpeg's console window hidden on Windows."""
+    if not sys.platform.startswith("win"):
+        return None
+    startupinfo = subprocess.STARTUPINFO()
+    startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    return startupinfo
+
+
+def _prevent_sigint() -> Dict[str, Any]:
+    """Get Popen arguments that keep Ctrl+C from reaching ffmpeg (as imageio did).
+
+    ffmpeg runs in its own process group, so an interrupt stops only Python
+    and close() can still let ffmpeg finish the file.
+    """
+    if sys.platform.startswith("win"):
+        return {"creationflags": 0x00000200}  # CREATE_NEW_PROCESS_GROUP
+    return {"preexec_fn": os.setpgrp}
+
+
+@lru_cache(maxsize=None)
+def codec_available(codec: str) -> bool:
+    """Check whether ffmpeg can actually encode with a codec.
+
+    ffmpeg builds list hardware encoders whether or not the hardware and
+    drivers are present, so this encodes one small test frame. The result
+    is cached for the lifetime of the process.
+
+    Args:
+        codec: ffmpeg video codec (e.g. 'h264_nvenc').
+
+    Returns:
+        True if the test encode succeeded.
+    """
+    cmd = [
+        get_ffmpeg_exe(), "-hide_banner", "-v", "error",
+        "-f", "lavfi", "-i", "color=size=256x256",
+        "-frames:v", "1", "-pix_fmt", "yuv420p", "-c:v", codec, "-f", "null", "-",
+    ]
+    try:
+        result = subprocess.run(
+            cmd, stdin=subprocess.DEVNULL, capture_output=True,
+            timeout=15, startupinfo=_startupinfo()
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+    return result.returncode == 0
+
+
+def select_codec(encoder: str) -> str:
+    """Get the ffmpeg codec for an encoder setting.
+
+    Args:
+        encoder: 'h264', 'h265', or 'auto' (first working hardware H.264
+            encoder, falling back to libx264).
+
+    Returns:
+        ffmpeg video codec name.
+    """
+    if encoder == "auto":
+        for codec in _AUTO_CODECS:
+            if codec_available(codec):
+                return codec
+        return "libx264"
+    return "libx264" if encoder == "h264" else "libx265"
+
+
+def quality_params(codec: str, preset: str, crf: int) -> List[str]:
+    """Get ffmpeg arguments for a preset and quality level on a codec.
+
+    Hardware encoders have no -crf; the closest constant-quality mode of
+    each is used with the same number.
+
+    Args:
+        codec: ffmpeg video codec.
+        preset: x264-style preset name (ultrafast ... veryslow).
+        crf: Constant rate factor (lower = better quality).
+
+    Returns:
+        List of ffmpeg output arguments.
+    """
+    if codec.endswith("_nvenc"):
+        return ["-preset", _NVENC_PRESETS.get(preset, "p4"), "-rc", "vbr", "-cq", str(crf), "-b:v", "0"]
+    if codec.endswith("_qsv"):
+        qsv_preset = "veryfast" if preset in ("ultrafast", "superfast") else preset
+        return ["-preset", qsv_preset, "-global_quality", str(crf)]
+    if codec.endswith("_amf"):
+        return ["-rc", "cqp", "-qp_i", str(crf), "-qp_p", str(crf)]
+    if codec.endswith("_videotoolbox"):
+        # Constant quality from 1 (worst) to 100; crf 0-51 mapped inversely
+        return ["-q:v", str(max(1, min(100, round(100 - crf * 100 / 51))))]
+    return ["-preset", preset, "-crf", str(crf)]
+
+
+def _enlarge_pipe(fd: int, size: int) -> None:
+    """Grow a pipe's kernel buffer so whole frames fit without blocking.
+
+    Linux pipes hold 64 KB by default, so writing a frame of several MB
+    takes many partial writes, each waiting for ffmpeg to read. Unprivileged
+    processes are capped at /proc/sys/fs/pipe-max-size, which is used
+    instead when size is larger. Does nothing on other platforms.
+
+    Args:
+        fd: File descriptor of the pipe.
+        size: Requested buffer size in bytes.
+    """
+    if fcntl is None or not sys.platform.startswith("linux"):
+        return
+
+    size = -(-size // _PAGE_SIZE) * _PAGE_SIZE
+    try:
+        fcntl.fcntl(fd, _F_SETPIPE_SZ, size)
+        return
+    except OSError:
+        pass
+
+    try:
+        with open("/proc/sys/fs/pipe-max-size") as f:
+            max_size = int(f.read())
+        fcntl.fcntl(fd, _F_SETPIPE_SZ, min(size, max_size))
+    except (OSError, ValueError) as e:
+        print(f"Warning: Could not enlarge the ffmpeg pipe buffer: {e}")
+
+
+class FFmpegWriter:
+    """Encodes RGB frames by writing their raw bytes to ffmpeg's stdin.
+
+    Frames must already be (height, width, 3) uint8 RGB. When both sides
+    are even they are converted to YUV 4:2:0 with OpenCV before writing,
+    which halves the bytes piped per frame and skips ffmpeg's own
+    (single-threaded) RGB to YUV conversion. Odd sizes are piped as RGB.
+    """
+
+    # Sizes are rounded up to a multiple of this (like imageio did) because
+    # most codecs and players expect whole macroblocks
+    MACRO_BLOCK_SIZE = 16
+
+    def __init__(
+        self,
+        path: str,
+        width: int,
+        height: int,
+        fps: int,
+        codec: str,
+        output_params: Optional[List[str]] = None,
+    ):
+        """Start the ffmpeg process.
+
+        Args:
+            path: Output video file path.
+            width: Frame width.
+            height: Frame height.
+            fps: Frames per second.
+            codec: ffmpeg video codec (e.g. 'libx264').
+            output_params: Extra ffmpeg output arguments (preset, crf, ...).
+
+        Raises:
+            FileNotFoundError: If the output directory does not exist.
+        """
+        # ffmpeg would only fail once the first frames are encoded
+        output_dir = os.path.dirname(os.path.abspath(path))
+        if not os.path.isdir(output_dir):
+            raise FileNotFoundError(f"Output directory '{output_dir}' does not exist")
+
+        # I420 stores chroma at half resolution, so it needs even sizes
+        self._yuv = None
+        if width % 2 == 0 and height % 2 == 0:
+            self._yuv = np.empty((height * 3 // 2, width), dtype=np.uint8)
+        input_format = "rgb24" if self._yuv is None else "yuv420p"
+
+        cmd = [
+            get_ffmpeg_exe(), "-y",
+            "-f", "rawvideo", "-vcodec", "rawvideo",
+            "-s", f"{width}x{height}", "-pix_fmt", input_format, "-r", f"{fps:.02f}",
+            "-i", "-",
+            "-vcodec", codec, "-pix_fmt", "yuv420p",
+        ]
+
+        block = self.MACRO_BLOCK_SIZE
+        out_w = -(-width // block) * block
+        out_h = -(-height // block) * block
+        if (out_w, out_h) != (width, height):
+            cmd += ["-vf", f"scale={out_w}:{out_h}"]
+
+        cmd += ["-v", "warning"] + list(output_params or []) + [path]
+
+        self._proc = subprocess.Popen(
+            cmd, stdin=subprocess.PIPE, startupinfo=_startupinfo(), **_prevent_sigint()
+        )
+        # Room for two frames, so rendering can run a frame ahead of ffmpeg
+        frame_bytes = width * height * 3 if self._yuv is None else self._yuv.nbytes
+        _enlarge_pipe(self._proc.stdin.fileno(), frame_bytes * 2)
+
+    def append_data(self, frame: np.ndarray) -> None:
+        """Write one frame to the encoder.
+
+        Args:
+            frame: RGB frame of the size given at construction.
+        """
+        if self._yuv is not None:
+            # Same BT.601 limited range that ffmpeg's yuv420p conversion uses
+            frame = cv2.cvtColor(frame, cv2.COLOR_RGB2YUV_I420, dst=self._yuv)
+        # Write straight from the array's memory; tobytes() would copy it first
+        self._proc.stdin.write(np.ascontiguousarray(frame).data)
+
+    def close(self) -> None:
+        """Finish encoding and wait for ffmpeg to write the file.
+
+        Raises:
+            RuntimeError: If ffmpeg exited with an error.
+        """
+        if self._proc.stdin.closed:
+            return
+        try:
+            self._proc.stdin.close()
+        except OSError:
+            # ffmpeg already exited; its return code tells what happened
+            pass
+        returncode = self._proc.wait()
+        if returncode != 0:
+            raise RuntimeError(f"ffmpeg exited with code {returncode}")
@@ -1,6 +1,8 @@
 """Image loading functionality for coverflow video generation."""
 
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List
 
@@ -34,10 +36,15 @@ class ImageLoader:
             print(f"Error: Source directory '{self.source_path}' does not exist")
             sys.exit(1)
 
-        image_files = []
-        for file in sorted(self.source_path.iterdir()):
-            if file.suffix.lower() in self.SUPPORTED_FORMATS:
-                image_files.append(file)
+        # Filter on names from os.scandir; only build Paths for kept entries
+        with os.scandir(self.source_path) as entries:
+            names = [
+                entry.name for entry in entries
+                if entry.is_file() and os.path.splitext(entry.name)[1].lower() in self.SUPPORTED_FORMATS
+            ]
+        # normcase folds case on Windows, matching how Paths compare there
+        names.sort(key=os.path.normcase)
+        image_files = [self.source_path / name for name in names]
 
         if not image_files:
             print(f"Error: No images found in '{self.source_path}'")
@@ -58,9 +65,15 @@ class ImageLoader:
         image_paths = self.load_paths()
 
         print("Loading images...")
+        # Decode in parallel: cv2.imread releases the GIL during file I/O and decoding
+        max_workers = min(32, (os.cpu_count() or 1) * 4, len(image_paths))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            raw_images = list(executor.map(
+                lambda path: cv2.imread(str(path), cv2.IMREAD_UNCHANGED), image_paths
+            ))
+
         images_data = []
-        for img_path in image_paths:
-            img = cv2.imread(str(img_path), cv2.IMREAD_UNCHANGED)
+        for img_path, img in zip(image_paths, raw_images):
             if img is not None:
                 # Ensure BGR or BGRA format (preserve alpha for transparency)
                 if len(img.shape) == 2:
@@ -1,39 +1,70 @@
 """Coverflow frame rendering."""
 
+import math
+import threading
+import weakref
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from multiprocessing import Pool, cpu_count
-from typing import List, Optional
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple
 
 import cv2
 import numpy as np
 
+from . import blending
 from .config import Config
-from .transforms import ImageTransformer
+from .transforms import ImageTransformer, PositionParams
+from .utils import get_decay_curve, get_increase_curve
+
+
+# Shared by all renderers for rendering the tiles of one frame concurrently.
+# Separate from the frame-level pools so tile work never waits on a frame.
+_tile_pool: Optional[ThreadPoolExecutor] = None
+_tile_pool_lock = threading.Lock()
+
+
+def _get_tile_pool() -> ThreadPoolExecutor:
+    """Get the shared tile thread pool, creating it on first use.
+
+    Returns:
+        Thread pool with one worker per CPU.
+    """
+    global _tile_pool
+    with _tile_pool_lock:
+        if _tile_pool is None:
+            _tile_pool = ThreadPoolExecutor(
+                max_workers=cpu_count(), thread_name_prefix="coverflow-tile"
+            )
+        return _tile_pool
 
 
 def _scale_single_image(args: tuple) -> np.ndarray:
-    """Scale a single image for parallel processing.
+    """Scale a single image to the render size and convert it to BGRA.
 
-    Module-level function required for multiprocessing.Pool.
+    Module-level function required for multiprocessing.Pool; also used for
+    sequential and on-the-fly scaling so all paths produce the same tiles.
 
     Args:
-        args: Tuple of (image, max_width, max_height).
+        args: Tuple of (image, max_width, max_height, rgb). With rgb set the
+            tile is converted to RGBA instead.
 
     Returns:
-        Scaled BGRA image.
+        Scaled BGRA (or RGBA) image.
     """
-    img, max_w, max_h = args
+    img, max_w, max_h, rgb = args
 
     # Resize to fit max dimensions while maintaining aspect ratio
-    h, w = img.shape[:2]
-    scale = min(max_w / w, max_h / h)
-    new_w = int(w * scale)
-    new_h = int(h * scale)
-    img_resized = cv2.resize(img, (new_w, new_h), interpolation=cv2.INTER_LINEAR)
+    img_resized = ImageTransformer.resize_to_fit(img, max_w, max_h)
 
-    # Convert to BGRA for alpha blending
+    # Convert to BGRA (or RGBA) once so the per-frame path never needs to
     if img_resized.shape[2] == 3:
-        img_resized = cv2.cvtColor(img_resized, cv2.COLOR_BGR2BGRA)
+        code = cv2.COLOR_BGR2RGBA if rgb else cv2.COLOR_BGR2BGRA
+        img_resized = cv2.cvtColor(img_resized, code)
+    elif rgb:
+        img_resized = cv2.cvtColor(img_resized, cv2.COLOR_BGRA2RGBA)
 
+    # Everything downstream (warp, reflection, blend) needs the alpha channel
+    assert img_resized.shape[2] == 4, "scaled images must be BGRA or RGBA"
     return img_resized
 
 
@@ -56,19 +87,59 @@ def parse_hex_color(hex_color: str) -> tuple:
 class CoverflowRenderer:
     """Renders coverflow frames."""
 
-    def __init__(self, config: Config):
+    # Positions are quantized to 1/POSITION_STEPS for tile cache lookups
+    POSITION_STEPS = 1024
+
+    def __init__(self, config: Config, channel_order: str = "bgr"):
         """Initialize the renderer.
 
         Args:
             config: Video generation configuration.
+            channel_order: Channel order of rendered frames, "bgr" (OpenCV)
+                or "rgb" (video encoders).
         """
         self.config = config
+        # Tiles and background are stored in the output order, so frames
+        # never need a per-frame channel swap
+        self._rgb = channel_order == "rgb"
         self.transformer = ImageTransformer()
         self.background_image = self._load_background(config.background)
-        # Cache for pre-scaled images (keyed by image id)
+        # Pre-scaled BGRA images packed by prepare_images(): slot i holds image i
+        # in atlas[i, :h, :w] with (h, w) = tile_bounds[i]
+        self._atlas: Optional[np.ndarray] = None
+        self._tile_bounds: Optional[np.ndarray] = None
+        # Images scaled on first use when prepare_images() was not called
         self._scaled_images_cache: dict = {}
-        # Cache for the background (created once, reused)
-        self._cached_background: Optional[np.ndarray] = None
+        # LRU cache of placed tiles keyed by (image index, quantized position).
+        # Hold frames and the flat ends of eased transitions repeat positions.
+        self._tile_cache: OrderedDict = OrderedDict()
+        self._tile_cache_lock = threading.Lock()
+        self._tile_cache_size = 4 * (2 * config.visible_range + 1)
+        # LRU cache of warped side tiles keyed by their pixel geometry (see
+        # _geometry_key), shared by positions that only differ in x
+        self._warp_cache: OrderedDict = OrderedDict()
+        # Areas drawn over in reused render_frame(out=...) buffers:
+        # id(buffer) -> (weakref to buffer, [(x1, y1, x2, y2), ...])
+        self._dirty_rects: dict = {}
+        # Curve functions resolved once from their configured names
+        self._scale_curve = get_decay_curve(config.side_scale_curve)
+        self._blur_curve = get_increase_curve(config.side_blur_curve)
+        self._alpha_curve = get_decay_curve(config.side_alpha_curve)
+        # Image-independent tile parameters, keyed by quantized position
+        self._position_params: dict = {}
+        # Back-to-front slot order, keyed by floor(2 * offset)
+        self._render_order_cache: dict = {}
+        # OpenCL (T-API) tile transforms, only if OpenCV can actually use it
+        self._use_opencl = config.use_opencl and cv2.ocl.haveOpenCL()
+        if config.use_opencl and not self._use_opencl:
+            print("Warning: OpenCL is not available, transforming tiles on the CPU")
+        # Background is identical for every frame: build it once (read-only template)
+        self._background_template = self._build_background()
+        if self._rgb:
+            self._background_template = cv2.cvtColor(self._background_template, cv2.COLOR_BGR2RGB)
+        self._background_template.flags.writeable = False
+        # Compile the blend kernel now rather than inside the first frame
+        blending.warm_up()
 
     def _load_background(self, path: Optional[str]) -> Optional[np.ndarray]:
         """Load and resize background image.
@@ -93,7 +164,9 @@ class CoverflowRenderer:
         scale = max(self.config.width / img_w, self.config.height / img_h)
         new_w = int(img_w * scale)
         new_h = int(img_h * scale)
-        img_resized = cv2.resize(img, (new_w, new_h), interpolation=cv2.INTER_LANCZOS4)
+        # INTER_AREA for downscaling, INTER_CUBIC for upscaling (Lanczos is much slower)
+        interpolation = cv2.INTER_AREA if scale < 1 else cv2.INTER_CUBIC
+        img_resized = cv2.resize(img, (new_w, new_h), interpolation=interpolation)
 
         # Center crop to canvas size
         x_offset = (new_w - self.config.width) // 2
@@ -102,51 +175,73 @@ class CoverflowRenderer:
 
         return img_cropped
 
-    def _create_background(self) -> np.ndarray:
-        """Create background canvas.
+    def _build_background(self) -> np.ndarray:
+        """Build the background template (gradient plus optional image overlay).
+
+        Called once from __init__; frames start from a copy of the result.
 
         Returns:
             Background canvas (color, custom image, or gradient).
         """
-        # Return cached background if available (just copy to avoid mutations)
-        if self._cached_background is not None:
-            return self._cached_background.copy()
-
         # Start with color or gradient as base
         if self.config.background_color:
             top_color = parse_hex_color(self.config.background_color)
             if self.config.background_color_bottom:
-                # Two-color vertical gradient (vectorized for speed)
+                # Two-color vertical gradient: build one (H, 1, 3) uint8 column,
+                # then materialize it across the width with a single copy
                 bottom_color = parse_hex_color(self.config.background_color_bottom)
-                t = np.linspace(0, 1, self.config.height).reshape(-1, 1, 1)
+                t = np.linspace(0, 1, self.config.height, dtype=np.float32).reshape(-1, 1, 1)
                 top_arr = np.array(top_color, dtype=np.float32)
                 bottom_arr = np.array(bottom_color, dtype=np.float32)
-                gradient = top_arr * (1 - t) + bottom_arr * t
-                canvas = np.broadcast_to(gradient, (self.config.height, self.config.width, 3)).astype(np.uint8).copy()
+                column = (top_arr * (1 - t) + bottom_arr * t).astype(np.uint8)
+                canvas = np.broadcast_to(column, (self.config.height, self.config.width, 3)).copy()
             else:
                 # Solid color
                 canvas = np.full((self.config.height, self.config.width, 3), top_color, dtype=np.uint8)
         else:
-            # Default: gradient background (dark gray to black) - vectorized
-            t = np.linspace(1, 0, self.config.height).reshape(-1, 1, 1)
-            intensity = (40 * t).astype(np.uint8)
-            canvas = np.broadcast_to(intensity, (self.config.height, self.config.width, 3)).copy()
+            # Default: gradient background (dark gray to black) - one column, one copy
+            t = np.linspace(1, 0, self.config.height, dtype=np.float32).reshape(-1, 1, 1)
+            column = (40 * t).astype(np.uint8)
+            canvas = np.broadcast_to(column, (self.config.height, self.config.width, 3)).copy()
 
         # Overlay background image if exists
         if self.background_image is not None:
             # Blend with alpha if BGRA, else just copy
             if len(self.background_image.shape) == 3 and self.background_image.shape[2] == 4:
-                alpha = self.background_image[:, :, 3:4] / 255.0
-                rgb = self.background_image[:, :, :3]
-                canvas = (rgb * alpha + canvas * (1 - alpha)).astype(np.uint8)
+                # OpenCV's vectorized blend avoids full-size float64 temporaries
+                alpha = self.background_image[:, :, 3].astype(np.float32) * (1 / 255.0)
+                rgb = np.ascontiguousarray(self.background_image[:, :, :3])
+                canvas = cv2.blendLinear(rgb, canvas, alpha, 1.0 - alpha)
             else:
                 canvas = self.background_image.copy()
 
-        # Cache the background for future use
-        self._cached_background = canvas.copy()
-
         return canvas
 
+    def _create_background(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Create a background canvas for one frame.
+
+        Frames may be rendered concurrently (motion blur sub-frames), so
+        without out each call gets its own copy of the prebuilt template. A
+        reused out buffer only has the rectangles drawn over by its previous
+        frame restored; any other buffer is fully overwritten.
+
+        Args:
+            out: Optional (height, width, 3) uint8 buffer to render into.
+
+        Returns:
+            Writable background canvas.
+        """
+        if out is None:
+            return self._background_template.copy()
+
+        entry = self._dirty_rects.pop(id(out), None)
+        if entry is not None and entry[0]() is out:
+            for x1, y1, x2, y2 in entry[1]:
+                out[y1:y2, x1:x2] = self._background_template[y1:y2, x1:x2]
+        else:
+            np.copyto(out, self._background_template)
+        return out
+
     def prepare_images(self, images: List[np.ndarray]) -> None:
         """Pre-scale and cache all images for faster rendering.
 
@@ -160,36 +255,49 @@ class CoverflowRenderer:
         max_img_height = int(self.config.height * self.config.image_scale)
 
         self._scaled_images_cache.clear()
+        self._atlas = None
+        self._tile_bounds = None
+        with self._tile_cache_lock:
+            self._tile_cache.clear()
+            self._warp_cache.clear()
+
+        if not images:
+            return
 
         # Threshold for parallel processing (pool overhead not worth it for small sets)
         MIN_IMAGES_FOR_PARALLEL = 10
 
         if len(images) >= MIN_IMAGES_FOR_PARALLEL:
             # Parallel processing for larger image sets
-            args = [(img, max_img_width, max_img_height) for img in images]
+            args = [(img, max_img_width, max_img_height, self._rgb) for img in images]
             num_workers = min(cpu_count(), len(images))
 
             with Pool(num_workers) as pool:
                 scaled_images = pool.map(_scale_single_image, args)
-
-            self._scaled_images_cache = {i: img for i, img in enumerate(scaled_images)}
         else:
             # Sequential processing for small sets (avoids pool overhead)
-            for idx, img in enumerate(images):
-                # Resize to fit max dimensions
-                img_resized = self.transformer.resize_to_fit(img, max_img_width, max_img_height)
-
-                # Convert to BGRA for alpha blending
-                if img_resized.shape[2] == 3:
-                    img_rgba = cv2.cvtColor(img_resized, cv2.COLOR_BGR2BGRA)
-                else:
-                    img_rgba = img_resized
-
-                # Cache using index as key
-                self._scaled_images_cache[idx] = img_rgba
+            scaled_images = [
+                _scale_single_image((img, max_img_width, max_img_height, self._rgb))
+                for img in images
+            ]
+
+        # Pack all tiles into one contiguous (N, max_h, max_w, 4) atlas instead
+        # of N separately allocated arrays
+        max_h = max(img.shape[0] for img in scaled_images)
+        max_w = max(img.shape[1] for img in scaled_images)
+        self._atlas = np.zeros((len(scaled_images), max_h, max_w, 4), dtype=np.uint8)
+        self._tile_bounds = np.empty((len(scaled_images), 2), dtype=np.int32)
+        for idx, img in enumerate(scaled_images):
+            h, w = img.shape[:2]
+            self._atlas[idx, :h, :w] = img
+            self._tile_bounds[idx] = (h, w)
 
     def _get_scaled_image(self, images: List[np.ndarray], idx: int) -> np.ndarray:
-        """Get a pre-scaled image from cache or scale on-the-fly.
+        """Get a pre-scaled image from the atlas or scale it on first use.
+
+        Images that were not prepared via prepare_images() (e.g. preview
+        rendering) are scaled lazily and cached, so each image is resized and
+        converted to BGRA only once per renderer.
 
         Args:
             images: List of original images.
@@ -198,24 +306,274 @@ class CoverflowRenderer:
         Returns:
             Scaled BGRA image.
         """
-        if idx in self._scaled_images_cache:
-            return self._scaled_images_cache[idx]
+        if self._atlas is not None and idx < len(self._atlas):
+            h, w = self._tile_bounds[idx]
+            return self._atlas[idx, :h, :w]
 
-        # Fallback: scale on-the-fly if not cached
+        img_rgba = self._scaled_images_cache.get(idx)
+        if img_rgba is not None:
+            return img_rgba
+
+        # Fallback: scale on first use and cache the result
         max_img_width = int(self.config.width * self.config.image_scale)
         max_img_height = int(self.config.height * self.config.image_scale)
 
-        img_resized = self.transformer.resize_to_fit(images[idx], max_img_width, max_img_height)
+        img_rgba = _scale_single_image((images[idx], max_img_width, max_img_height, self._rgb))
+        self._scaled_images_cache[idx] = img_rgba
+        return img_rgba
 
-        if img_resized.shape[2] == 3:
-            img_rgba = cv2.cvtColor(img_resized, cv2.COLOR_BGR2BGRA)
-        else:
-            img_rgba = img_resized
+    def _render_order(self, offset: float) -> List[int]:
+        """Get slot indices in back-to-front drawing order for an offset.
 
-        return img_rgba
+        Depth is |i - offset|, which falls monotonically from both ends of the
+        slot range toward the center, so walking inward from both ends and
+        always taking the deeper side yields the order without sorting. On
+        ties the left slot is drawn first.
+
+        Args:
+            offset: Animation offset of the current frame.
+
+        Returns:
+            Slot indices (relative to the center image), farthest first.
+        """
+        # For integer slots l < r, the left side is drawn first exactly when
+        # offset >= (l + r) / 2, so the order only depends on floor(2 * offset)
+        key = math.floor(2 * offset)
+        order = self._render_order_cache.get(key)
+        if order is not None:
+            return order
+
+        left = -self.config.visible_range
+        right = self.config.visible_range
+        order = []
+        while left <= right:
+            if abs(left - offset) >= abs(right - offset):
+                order.append(left)
+                left += 1
+            else:
+                order.append(right)
+                right -= 1
+        self._render_order_cache[key] = order
+        return order
+
+    def _lookup_tile(self, img_idx: int, position: float) -> Optional[tuple]:
+        """Get a tile from the tile cache without rendering it.
+
+        Args:
+            img_idx: Image index.
+            position: Position relative to center (0 = center).
+
+        Returns:
+            Tile tuple as returned by _get_tile, or None if not cached.
+        """
+        key = (img_idx, round(position * self.POSITION_STEPS))
+        with self._tile_cache_lock:
+            cached = self._tile_cache.get(key)
+            if cached is not None:
+                self._tile_cache.move_to_end(key)
+            return cached
+
+    def _get_tiles(
+        self, images: List[np.ndarray], slots: List[Tuple[int, float]]
+    ) -> List[tuple]:
+        """Get the tiles for several (img_idx, position) slots.
+
+        Cache misses are rendered concurrently on the shared tile pool, as the
+        resize and warp work in OpenCV releases the GIL.
+
+        Args:
+            images: List of images.
+            slots: List of (img_idx, position) pairs.
+
+        Returns:
+            Tile tuples as returned by _get_tile, in the order of slots.
+        """
+        tiles = [self._lookup_tile(img_idx, position) for img_idx, position in slots]
+        misses = [k for k, tile in enumerate(tiles) if tile is None]
+
+        if len(misses) == 1:
+            k = misses[0]
+            tiles[k] = self._get_tile(images, *slots[k])
+        elif misses:
+            rendered = _get_tile_pool().map(
+                lambda k: self._get_tile(images, *slots[k]), misses
+            )
+            for k, tile in zip(misses, rendered):
+                tiles[k] = tile
+
+        return tiles
+
+    def _get_tile(
+        self, images: List[np.ndarray], img_idx: int, position: float
+    ) -> Tuple[Optional[np.ndarray], int, int, Optional[np.ndarray], int, int]:
+        """Get the transformed tile and reflection for an image at a position.
+
+        Results are memoized by (img_idx, quantized position), so repeated
+        positions skip the resize, perspective warp and reflection work.
+
+        Args:
+            images: List of images.
+            img_idx: Image index.
+            position: Position relative to center (0 = center).
+
+        Returns:
+            Tuple of (tile or None, x, y, reflection or None, reflection x, reflection y).
+        """
+        cached = self._lookup_tile(img_idx, position)
+        if cached is not None:
+            return cached
+
+        position_q = round(position * self.POSITION_STEPS)
+        key = (img_idx, position_q)
+
+        # Render at the quantized position so a cached tile is deterministic
+        position = position_q / self.POSITION_STEPS
+
+        params = self._get_position_params(position_q)
+
+        # Alpha is truncated to uint8, so a factor below 1/255 makes the tile
+        # (and a reflection below 1/255 of full opacity) fully transparent
+        alpha_factor = params.alpha_factor
+        if int(alpha_factor * 255) == 0:
+            return self._store_tile(key, (None, 0, 0, None, 0, 0))
+
+        # Get pre-scaled image from cache (or scale on-the-fly as fallback)
+        img_rgba = self._get_scaled_image(images, img_idx)
+
+        # Nearby positions often warp to the same pixels: reuse that tile and
+        # its reflection, only moving it horizontally
+        geometry_key = self._geometry_key(img_idx, img_rgba, position, params)
+        if geometry_key is not None:
+            with self._tile_cache_lock:
+                warped = self._warp_cache.get(geometry_key)
+                if warped is not None:
+                    self._warp_cache.move_to_end(geometry_key)
+            if warped is not None:
+                transformed, y_pos, reflection, refl_y = warped
+                x_pos = self.transformer.arc_x_offset(
+                    position, transformed.shape[1], self.config.width,
+                    self.config.spacing, params.position_scale
+                )
+                refl_x = x_pos if reflection is not None else 0
+                return self._store_tile(key, (transformed, x_pos, y_pos, reflection, refl_x, refl_y))
+
+        # Apply perspective transform
+        transformed, x_pos, y_pos = self.transformer.apply_perspective(
+            img_rgba, position, self.config.width, self.config.height,
+            self.config.perspective, self.config.side_scale, self.config.spacing,
+            self.config.mode, self.config.side_blur, self.config.side_alpha,
+            self.config.side_scale_curve, self.config.side_blur_curve, self.config.side_alpha_curve,
+            self.config.side_scale_start, self.config.side_blur_start, self.config.side_alpha_start,
+            params=params, fast_blur=self.config.fast_blur, fast_warp=self.config.fast_warp,
+            use_opencl=self._use_opencl
+        )
+
+        reflection, refl_x, refl_y = None, 0, 0
+        if transformed is not None:
+            # Calculate base y position from image_y setting
+            base_y = int(self.config.height * self.config.image_y - transformed.shape[0] / 2)
+
+            # Apply alignment adjustment
+            if self.config.alignment == "bottom":
+                y_pos = int(base_y + transformed.shape[0] / 2)
+            elif self.config.alignment == "top":
+                y_pos = int(base_y - transformed.shape[0] / 2)
+            else:  # center (default)
+                y_pos = base_y
+
+            # Add reflection if enabled (optimized: reuse already-transformed image)
+            if alpha_factor * self.config.reflection * 255 >= 1:
+                reflection, refl_x, _ = self.transformer.create_reflection(
+                    transformed, x_pos,
+                    alpha=self.config.reflection,
+                    reflection_length=self.config.reflection_length,
+                )
+                refl_y = y_pos + transformed.shape[0] + 5
+
+        if geometry_key is not None and transformed is not None:
+            with self._tile_cache_lock:
+                self._warp_cache[geometry_key] = (transformed, y_pos, reflection, refl_y)
+                if len(self._warp_cache) > self._tile_cache_size:
+                    self._warp_cache.popitem(last=False)
+
+        return self._store_tile(key, (transformed, x_pos, y_pos, reflection, refl_x, refl_y))
+
+    def _geometry_key(
+        self, img_idx: int, img: np.ndarray, position: float, params: PositionParams
+    ) -> Optional[tuple]:
+        """Get the key identifying the pixels of an arc-mode side tile.
+
+        Two positions with the same key produce an identical warped tile and
+        reflection; only the x position differs. The blur and alpha values
+        are part of the key as-is, so reuse never changes the output.
+
+        Args:
+            img_idx: Image index.
+            img: Pre-scaled BGRA image.
+            position: Position relative to center (0 = center).
+            params: PositionParams for the position.
+
+        Returns:
+            Hashable key, or None for tiles that are not warped (center or flat mode).
+        """
+        if self.config.mode == "flat" or abs(position) < 0.01:
+            return None
+
+        h, w = img.shape[:2]
+        new_w, new_h = int(w * params.scale), int(h * params.scale)
+        h_inset, v_inset = self.transformer.perspective_insets(
+            new_w, new_h, abs(position) * self.config.perspective
+        )
+        return (
+            img_idx, new_w, new_h, h_inset, v_inset, position < 0,
+            params.ksize, params.blur_amount, params.alpha_factor,
+        )
+
+    def _get_position_params(self, position_q: int) -> PositionParams:
+        """Get the image-independent tile parameters for a quantized position.
+
+        Every image at the same position shares the curve math, so it is
+        computed once per position.
+
+        Args:
+            position_q: Position quantized to 1/POSITION_STEPS.
+
+        Returns:
+            PositionParams for the position.
+        """
+        params = self._position_params.get(position_q)
+        if params is None:
+            params = self.transformer.get_position_params(
+                position_q / self.POSITION_STEPS,
+                self.config.side_scale, self.config.side_blur, self.config.side_alpha,
+                self._scale_curve, self._blur_curve, self._alpha_curve,
+                self.config.side_scale_start, self.config.side_blur_start, self.config.side_alpha_start
+            )
+            self._position_params[position_q] = params
+        return params
+
+    def _store_tile(self, key: Tuple[int, int], tile: tuple) -> tuple:
+        """Insert a tile into the LRU tile cache, evicting the oldest entry.
+
+        Args:
+            key: Cache key of (img_idx, quantized position).
+            tile: Tile tuple as returned by _get_tile.
+
+        Returns:
+            The stored tile.
+        """
+        with self._tile_cache_lock:
+            self._tile_cache[key] = tile
+            if len(self._tile_cache) > self._tile_cache_size:
+                self._tile_cache.popitem(last=False)
+        return tile
 
     def render_frame(
-        self, images: List[np.ndarray], center_idx: int, offset: float
+        self,
+        images: List[np.ndarray],
+        center_idx: int,
+        offset: float,
+        out: Optional[np.ndarray] = None,
     ) -> np.ndarray:
         """Render a single coverflow frame.
 
@@ -223,81 +581,115 @@ class CoverflowRenderer:
             images: List of images.
             center_idx: Index of the center image.
             offset: Animation offset from -1.0 to 1.0 for transitions.
+            out: Optional (height, width, 3) uint8 buffer to render into. When
+                the same buffer is passed again, only the areas covered by the
+                previous frame are reset, so it must not be modified in between.
 
         Returns:
-            Rendered frame as numpy array.
+            Rendered frame as numpy array in the renderer's channel order
+            (out, if given).
         """
-        canvas = self._create_background()
+        canvas = self._create_background(out)
+        # Areas drawn over in a reused buffer, restored before its next frame
+        dirty_rects = [] if out is not None else None
 
-        # Collect images to render with their z-order (depth)
-        to_render = []
+        num_images = len(images)
 
-        for i in range(-self.config.visible_range, self.config.visible_range + 1):
+        # Collect visible slots, far images first and center last
+        slots = []
+        for i in self._render_order(offset):
             img_idx = center_idx + i
 
             # Wrap around if repeat is enabled
             if self.config.repeat:
-                img_idx = img_idx % len(images)
-
-            if 0 <= img_idx < len(images):
-                # Calculate position with offset
-                position = i - offset
+                img_idx = img_idx % num_images
 
-                # Get depth for z-ordering (center = highest z)
-                depth = abs(position)
+            if not 0 <= img_idx < num_images:
+                continue
 
-                # Store index instead of image for cache lookup
-                to_render.append((depth, position, img_idx))
+            # Calculate position with offset
+            slots.append((img_idx, i - offset))
 
-        # Sort by depth (render far images first, center last)
-        to_render.sort(key=lambda x: -x[0])
+        # Render each image in that order
+        for tile in self._get_tiles(images, slots):
+            transformed, x_pos, y_pos, reflection, refl_x, refl_y = tile
 
-        # Maximum image size
-        max_img_width = int(self.config.width * self.config.image_scale)
-        max_img_height = int(self.config.height * self.config.image_scale)
+            if transformed is not None:
+                # Blend into the canvas in place
+                rect = self.transformer.blend_into_canvas(canvas, transformed, x_pos, y_pos)
+                if dirty_rects is not None and rect is not None:
+                    dirty_rects.append(rect)
+
+                if reflection is not None:
+                    rect = self.transformer.blend_into_canvas(canvas, reflection, refl_x, refl_y)
+                    if dirty_rects is not None and rect is not None:
+                        dirty_rects.append(rect)
+
+        if out is not None:
+            key = id(out)
+            # Drop the entry once the buffer is garbage collected
+            ref = weakref.ref(out, lambda _, key=key: self._dirty_rects.pop(key, None))
+            self._dirty_rects[key] = (ref, dirty_rects)
 
-        # Render each image
-        for depth, position, img_idx in to_render:
-            # Get pre-scaled image from cache (or scale on-the-fly as fallback)
-            img_rgba = self._get_scaled_image(images, img_idx)
-
-            # Apply perspective transform
-            transformed, x_pos, y_pos = self.transformer.apply_perspective(
-                img_rgba, position, self.config.width, self.config.height,
-                self.config.perspective, self.config.side_scale, self.config.spacing,
-                self.config.mode, self.config.side_blur, self.config.side_alpha,
-                self.config.side_scale_curve, self.config.side_blur_curve, self.config.side_alpha_curve,
-                self.config.side_scale_start, self.config.side_blur_start, self.config.side_alpha_start
-            )
+        return canvas
 
-            if transformed is not None:
-                # Calculate base y position from image_y setting
-                base_y = int(self.config.height * self.config.image_y - transformed.shape[0] / 2)
-
-                # Apply alignment adjustment
-                if self.config.alignment == "bottom":
-                    y_pos = int(base_y + transformed.shape[0] / 2)
-                elif self.config.alignment == "top":
-                    y_pos = int(base_y - transformed.shape[0] / 2)
-                else:  # center (default)
-                    y_pos = base_y
-
-                # Blend onto canvas
-                canvas = self.transformer.blend_onto_canvas(
-                    canvas, transformed, x_pos, y_pos
-                )
+    def render_frames(
+        self,
+        images: List[np.ndarray],
+        frame_specs: Sequence[Tuple[int, float]],
+        max_workers: Optional[int] = None,
+        reuse_buffers: bool = False,
+        get_buffer: Optional[Callable[[], np.ndarray]] = None,
+    ) -> Iterator[np.ndarray]:
+        """Render several frames in parallel and yield them in order.
+
+        Frames are independent of each other and the heavy work (resize,
+        warpPerspective, alpha blending) releases the GIL inside OpenCV/NumPy,
+        so threads scale across cores without pickling frames to processes.
+        At most 2 * max_workers frames are in flight to bound memory use.
 
-                # Add reflection if enabled (optimized: reuse already-transformed image)
-                if self.config.reflection > 0:
-                    reflection, refl_x, _ = self.transformer.create_reflection_from_transformed(
-                        transformed, x_pos,
-                        alpha=self.config.reflection,
-                        reflection_length=self.config.reflection_length,
+        Args:
+            images: List of images.
+            frame_specs: Sequence of (center_idx, offset) pairs, one per frame.
+            max_workers: Number of render threads (default: CPU count).
+            reuse_buffers: Render into a ring of preallocated buffers, one per
+                in-flight frame. A yielded frame is then only valid until the
+                next one is requested, so the caller must copy it to keep it.
+            get_buffer: Called for the output buffer of each frame instead,
+                e.g. to take it from a pool the caller recycles. It may block
+                until a buffer is free, so the pool must hold at least
+                2 * max_workers buffers.
+
+        Yields:
+            Rendered frames in the order of frame_specs.
+        """
+        workers = max_workers or cpu_count()
+        max_in_flight = workers * 2
+
+        # Frame n reuses the buffer of frame n - max_in_flight, which has
+        # already been yielded and released by the time frame n is submitted
+        buffers = None
+        if reuse_buffers:
+            shape = (self.config.height, self.config.width, 3)
+            buffers = [np.empty(shape, dtype=np.uint8) for _ in range(max_in_flight)]
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            try:
+                for n, (center_idx, offset) in enumerate(frame_specs):
+                    if get_buffer is not None:
+                        out = get_buffer()
+                    else:
+                        out = buffers[n % max_in_flight] if buffers is not None else None
+                    pending.append(
+                        executor.submit(self.render_frame, images, center_idx, offset, out)
                     )
-                    if reflection is not None:
-                        refl_y = y_pos + transformed.shape[0] + 5
-                        canvas = self.transformer.blend_onto_canvas(
-                            canvas, reflection, refl_x, refl_y
-                        )
-
-        return canvas
+                    if len(pending) >= max_in_flight:
+                        yield pending.popleft().result()
+
+                while pending:
+                    yield pending.popleft().result()
+            finally:
+                # Consumer stopped early (e.g. cancelled): drop queued work
+                for future in pending:
+                    future.cancel()
@@ -1,12 +1,105 @@
 """Image transformation functions for coverflow effect."""
 
+import math
 import threading
-from typing import Optional, Tuple
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Optional, Tuple
 
 import cv2
 import numpy as np
 
-from .utils import apply_decay_curve, apply_increase_curve
+from .blending import blend_bgra_over_bgr
+from .utils import get_decay_curve, get_increase_curve
+
+
+@lru_cache(maxsize=128)
+def _reflection_gradient(height: int, alpha: float) -> np.ndarray:
+    """Get the (height, 1) reflection fade from alpha at the top to 0.
+
+    Cached because reflections of the same height recur across frames.
+
+    Args:
+        height: Reflection height in pixels.
+        alpha: Overall opacity of the reflection (0.0 to 1.0).
+
+    Returns:
+        Read-only column of alpha multipliers scaled to 0-255. Stored as
+        uint16 so multiplying a uint8 alpha channel cannot overflow.
+    """
+    gradient = np.linspace(1.0, 0, height, dtype=np.float32) * (alpha * 255)
+    gradient = gradient.astype(np.uint16).reshape(-1, 1)
+    gradient.flags.writeable = False
+    return gradient
+
+
+@lru_cache(maxsize=256)
+def _alpha_lut(alpha_factor: float) -> np.ndarray:
+    """Get the 256-entry table that scales an alpha value by alpha_factor.
+
+    cv2.LUT with this table gives the same result as
+    (alpha * alpha_factor).astype(np.uint8) without a float64 temporary.
+
+    Args:
+        alpha_factor: Opacity multiplier (0.0 to 1.0).
+
+    Returns:
+        Read-only uint8 lookup table.
+    """
+    lut = (np.arange(256) * alpha_factor).astype(np.uint8)
+    lut.flags.writeable = False
+    return lut
+
+
+@lru_cache(maxsize=256)
+def _alpha_lut_bgra(alpha_factor: float) -> np.ndarray:
+    """Get a per-channel table that keeps BGR and scales alpha by alpha_factor.
+
+    cv2.UMat images cannot be sliced, so their alpha channel is faded by
+    running all four channels through this table.
+
+    Args:
+        alpha_factor: Opacity multiplier (0.0 to 1.0).
+
+    Returns:
+        Read-only (1, 256, 4) uint8 lookup table.
+    """
+    identity = np.arange(256, dtype=np.uint8)
+    lut = np.dstack([identity, identity, identity, _alpha_lut(alpha_factor)])
+    lut.flags.writeable = False
+    return lut
+
+
+def _fade_alpha(img, alpha_factor: float):
+    """Scale the alpha channel of a BGRA image by alpha_factor.
+
+    Args:
+        img: BGRA image as a NumPy array (faded in place) or cv2.UMat.
+        alpha_factor: Opacity multiplier (0.0 to 1.0).
+
+    Returns:
+        The faded image.
+    """
+    if isinstance(img, cv2.UMat):
+        return cv2.LUT(img, _alpha_lut_bgra(alpha_factor))
+    img[:, :, 3] = cv2.LUT(img[:, :, 3], _alpha_lut(alpha_factor))
+    return img
+
+
+def _to_array(img) -> np.ndarray:
+    """Download a cv2.UMat to a NumPy array; NumPy arrays pass through."""
+    return img.get() if isinstance(img, cv2.UMat) else img
+
+
+@dataclass(frozen=True)
+class PositionParams:
+    """Parameters of a tile that depend only on its position, not the image."""
+
+    position_scale: float  # Exponential scale used for spacing
+    scale: float  # Visual scale of the image (from side_scale_curve)
+    blur_amount: float  # Gaussian blur sigma (0 = no blur)
+    ksize: int  # Gaussian blur kernel size (1 = no blur)
+    alpha_factor: float  # Opacity multiplier (1.0 = unchanged)
 
 
 class ImageTransformer:
@@ -20,7 +113,8 @@ class ImageTransformer:
     def resize_to_fit(img: np.ndarray, max_width: int, max_height: int) -> np.ndarray:
         """Resize image to fit within bounds while maintaining aspect ratio.
 
-        Uses INTER_LINEAR for speed during pre-scaling (good quality/speed balance).
+        Uses INTER_AREA when shrinking (fast and alias-free) and INTER_LINEAR
+        when enlarging.
 
         Args:
             img: Input image.
@@ -34,7 +128,142 @@ class ImageTransformer:
         scale = min(max_width / w, max_height / h)
         new_w = int(w * scale)
         new_h = int(h * scale)
-        return cv2.resize(img, (new_w, new_h), interpolation=cv2.INTER_LINEAR)
+        interpolation = cv2.INTER_AREA if scale < 1 else cv2.INTER_LINEAR
+        return cv2.resize(img, (new_w, new_h), interpolation=interpolation)
+
+    @staticmethod
+    def get_position_params(
+        angle: float, side_scale: float, side_blur: float, side_alpha: float,
+        side_scale_curve: Callable[[float, float], float],
+        side_blur_curve: Callable[[float, float], float],
+        side_alpha_curve: Callable[[float, float], float],
+        side_scale_start: int, side_blur_start: int, side_alpha_start: int
+    ) -> PositionParams:
+        """Compute the image-independent parameters for a position.
+
+        Curves are passed as functions (see utils.get_decay_curve and
+        utils.get_increase_curve) so callers resolve the names only once.
+
+        Args:
+            angle: Position relative to center (0 = center).
+            side_scale: How much side images shrink (0 = same size).
+            side_blur: Blur amount for side images (0 = no blur, higher = more blur).
+            side_alpha: Opacity for side images (1.0 = fully visible, lower = fades).
+            side_scale_curve: Decay curve function for side_scale effect.
+            side_blur_curve: Increase curve function for side_blur effect.
+            side_alpha_curve: Decay curve function for side_alpha effect.
+            side_scale_start: Position where scale effect begins (1 = immediate).
+            side_blur_start: Position where blur effect begins (1 = immediate).
+            side_alpha_start: Position where alpha effect begins (1 = immediate).
+
+        Returns:
+            PositionParams for the position.
+        """
+        abs_angle = abs(angle)
+
+        # Position scale always uses exponential (for consistent spacing)
+        position_scale = side_scale ** abs_angle if side_scale > 0 else 1.0
+
+        # Calculate effective angle for scale (offset by start index)
+        effective_scale_angle = max(0, abs_angle - (side_scale_start - 1))
+
+        # Visual scale uses selected curve (for image sizing)
+        scale = side_scale_curve(side_scale, effective_scale_angle) if side_scale > 0 else 1.0
+
+        # Blur uses selected curve (increase: 0 at center)
+        # Calculate effective angle for blur (offset by start index)
+        blur_amount = 0.0
+        ksize = 1
+        effective_blur_angle = max(0, abs_angle - (side_blur_start - 1))
+        if side_blur > 0 and effective_blur_angle > 0.01:
+            blur_amount = side_blur_curve(side_blur, effective_blur_angle)
+            ksize = int(blur_amount) * 2 + 1
+
+        alpha_factor = ImageTransformer.side_alpha_factor(
+            angle, side_alpha, side_alpha_curve, side_alpha_start
+        )
+
+        return PositionParams(position_scale, scale, blur_amount, ksize, alpha_factor)
+
+    @staticmethod
+    def side_alpha_factor(
+        angle: float, side_alpha: float,
+        side_alpha_curve: Callable[[float, float], float], side_alpha_start: int
+    ) -> float:
+        """Get the opacity multiplier applied to an image at a position.
+
+        Args:
+            angle: Position relative to center (0 = center).
+            side_alpha: Opacity for side images (1.0 = fully visible, lower = fades).
+            side_alpha_curve: Decay curve function for side_alpha effect.
+            side_alpha_start: Position where alpha effect begins (1 = immediate).
+
+        Returns:
+            Alpha factor from 0.0 to 1.0 (1.0 = unchanged).
+        """
+        # Calculate effective angle for alpha (offset by start index)
+        effective_alpha_angle = max(0, abs(angle) - (side_alpha_start - 1))
+        if side_alpha < 1.0 and effective_alpha_angle > 0.01:
+            return side_alpha_curve(side_alpha, effective_alpha_angle)
+        return 1.0
+
+    @staticmethod
+    def get_perspective_matrix(
+        width: int, height: int, h_inset: int, v_inset: int, is_left: bool
+    ) -> np.ndarray:
+        """Get the perspective matrix for a rotated page, computing it once.
+
+        The matrix only depends on the tile size and the far-edge insets, so it
+        is shared by every image and frame that lands on the same geometry.
+
+        Args:
+            width: Tile width.
+            height: Tile height.
+            h_inset: Horizontal inset of the far edge.
+            v_inset: Vertical inset of the far edge (top and bottom).
+            is_left: True if the left edge is the far edge.
+
+        Returns:
+            3x3 perspective transform matrix.
+        """
+        cache_key = (width, height, h_inset, v_inset, is_left)
+
+        # Thread-safe cache access for parallel rendering
+        with ImageTransformer._perspective_cache_lock:
+            cached = ImageTransformer._perspective_cache.get(cache_key)
+
+        if cached is not None:
+            return cached
+
+        # Source points (original rectangle)
+        pts1 = np.float32([
+            [0, 0],              # top-left
+            [width, 0],          # top-right
+            [0, height],         # bottom-left
+            [width, height]      # bottom-right
+        ])
+
+        if is_left:  # Left side - left edge is far (smaller)
+            pts2 = np.float32([
+                [h_inset, v_inset],              # top-left: moves right and down
+                [width, 0],                      # top-right: stays
+                [h_inset, height - v_inset],     # bottom-left: moves right and up
+                [width, height]                  # bottom-right: stays
+            ])
+        else:  # Right side - right edge is far (smaller)
+            pts2 = np.float32([
+                [0, 0],                               # top-left: stays
+                [width - h_inset, v_inset],           # top-right: moves left and down
+                [0, height],                          # bottom-left: stays
+                [width - h_inset, height - v_inset]   # bottom-right: moves left and up
+            ])
+
+        # Compute and cache perspective transform matrix (thread-safe write)
+        matrix = cv2.getPerspectiveTransform(pts1, pts2)
+        with ImageTransformer._perspective_cache_lock:
+            ImageTransformer._perspective_cache[cache_key] = matrix
+
+        return matrix
 
     @staticmethod
     def apply_perspective(
@@ -43,7 +272,9 @@ class ImageTransformer:
         mode: str = "arc", side_blur: float = 0.0, side_alpha: float = 1.0,
         side_scale_curve: str = "exponential", side_blur_curve: str = "linear",
         side_alpha_curve: str = "exponential",
-        side_scale_start: int = 1, side_blur_start: int = 1, side_alpha_start: int = 1
+        side_scale_start: int = 1, side_blur_start: int = 1, side_alpha_start: int = 1,
+        params: Optional[PositionParams] = None, fast_blur: bool = False,
+        fast_warp: bool = False, use_opencl: bool = False
     ) -> Tuple[Optional[np.ndarray], int, int]:
         """Apply a 3D perspective transform to simulate coverflow effect.
 
@@ -51,7 +282,7 @@ class ImageTransformer:
         a page rotated around its vertical axis.
 
         Args:
-            img: Input image.
+            img: Input image (BGRA, as produced by CoverflowRenderer.prepare_images).
             angle: Position angle from -1.0 (left) to 0.0 (center) to 1.0 (right).
             canvas_width: Width of the target canvas.
             canvas_height: Height of the target canvas.
@@ -67,6 +298,15 @@ class ImageTransformer:
             side_scale_start: Position where scale effect begins (1 = immediate).
             side_blur_start: Position where blur effect begins (1 = immediate).
             side_alpha_start: Position where alpha effect begins (1 = immediate).
+            params: Precomputed get_position_params() result for this angle
+                and these settings; computed here when omitted.
+            fast_blur: Approximate the Gaussian side blur with three box filter
+                passes, whose cost does not grow with the blur radius.
+            fast_warp: Warp heavily faded or blurred side images with
+                nearest-neighbor instead of bilinear interpolation.
+            use_opencl: Run the resize, blur, fade and warp on cv2.UMat so
+                OpenCV can dispatch them to OpenCL. The result is downloaded
+                back to a NumPy array.
 
         Returns:
             Tuple of (transformed image or None, x_offset, y_offset).
@@ -74,14 +314,18 @@ class ImageTransformer:
         h, w = img.shape[:2]
         abs_angle = abs(angle)
 
-        # Position scale always uses exponential (for consistent spacing)
-        position_scale = side_scale ** abs_angle if side_scale > 0 else 1.0
-
-        # Calculate effective angle for scale (offset by start index)
-        effective_scale_angle = max(0, abs_angle - (side_scale_start - 1))
-
-        # Visual scale uses selected curve (for image sizing)
-        scale = apply_decay_curve(side_scale, effective_scale_angle, side_scale_curve) if side_scale > 0 else 1.0
+        if params is None:
+            params = ImageTransformer.get_position_params(
+                angle, side_scale, side_blur, side_alpha,
+                get_decay_curve(side_scale_curve), get_increase_curve(side_blur_curve),
+                get_decay_curve(side_alpha_curve),
+                side_scale_start, side_blur_start, side_alpha_start
+            )
+        position_scale = params.position_scale
+        scale = params.scale
+        blur_amount = params.blur_amount
+        ksize = params.ksize
+        alpha_factor = params.alpha_factor
 
         # Scale both dimensions uniformly first
         new_w = int(w * scale)
@@ -90,34 +334,52 @@ class ImageTransformer:
         if new_w <= 0 or new_h <= 0:
             return None, 0, 0
 
-        # Resize image
-        img_scaled = cv2.resize(img, (new_w, new_h), interpolation=cv2.INTER_LANCZOS4)
+        # Interpolation quality is lost on images that end up mostly
+        # transparent or smeared by the blur anyway
+        if fast_warp and (alpha_factor < 0.4 or ksize > 7):
+            warp_interpolation = cv2.INTER_NEAREST
+        else:
+            warp_interpolation = cv2.INTER_LINEAR
+
+        if use_opencl:
+            img = cv2.UMat(img)
+
+        # Unblurred arc side images: fold the resize into the perspective warp
+        # so the source is resampled once. A bilinear warp does no low-pass
+        # filtering, so stronger shrinks keep the INTER_AREA resize below to
+        # avoid aliasing (shimmer on detailed covers as positions move).
+        MIN_FUSED_WARP_SCALE = 0.75
+        if mode != "flat" and abs_angle >= 0.01 and ksize <= 1 and scale >= MIN_FUSED_WARP_SCALE:
+            transformed = ImageTransformer._warp_scaled(
+                img, new_w, new_h, abs_angle * perspective, is_left=angle < 0,
+                interpolation=warp_interpolation, src_size=(w, h)
+            )
+            if alpha_factor < 1.0:
+                transformed = _fade_alpha(transformed, alpha_factor)
+
+            x_offset = ImageTransformer.arc_x_offset(angle, new_w, canvas_width, spacing, position_scale)
+            y_offset = int((canvas_height - new_h) / 2)
+            return _to_array(transformed), x_offset, y_offset
 
-        # Ensure BGRA format for alpha channel
-        if img_scaled.shape[2] == 3:
-            img_scaled = cv2.cvtColor(img_scaled, cv2.COLOR_BGR2BGRA)
+        # Resize image (AREA when shrinking, LINEAR otherwise; Lanczos is far slower)
+        interpolation = cv2.INTER_AREA if scale < 1 else cv2.INTER_LINEAR
+        img_scaled = cv2.resize(img, (new_w, new_h), interpolation=interpolation)
 
-        # Apply blur if configured using selected curve (increase: 0 at center)
-        # Calculate effective angle for blur (offset by start index)
-        effective_blur_angle = max(0, abs_angle - (side_blur_start - 1))
-        if side_blur > 0 and effective_blur_angle > 0.01:
-            blur_amount = apply_increase_curve(side_blur, effective_blur_angle, side_blur_curve)
-            ksize = int(blur_amount) * 2 + 1
-            if ksize > 1:
+        if ksize > 1:
+            if fast_blur:
+                img_scaled = ImageTransformer.box_blur(img_scaled, ksize, blur_amount)
+            else:
                 img_scaled = cv2.GaussianBlur(img_scaled, (ksize, ksize), blur_amount)
 
         # Apply alpha fade if configured using selected curve (decay: 1.0 at center)
-        # Calculate effective angle for alpha (offset by start index)
-        effective_alpha_angle = max(0, abs_angle - (side_alpha_start - 1))
-        if side_alpha < 1.0 and effective_alpha_angle > 0.01:
-            alpha_factor = apply_decay_curve(side_alpha, effective_alpha_angle, side_alpha_curve)
-            img_scaled[:, :, 3] = (img_scaled[:, :, 3] * alpha_factor).astype(np.uint8)
+        if alpha_factor < 1.0:
+            img_scaled = _fade_alpha(img_scaled, alpha_factor)
 
         # For center image, no perspective needed
         if abs_angle < 0.01:
             x_offset = int((canvas_width - new_w) / 2)
             y_offset = int((canvas_height - new_h) / 2)
-            return img_scaled, x_offset, y_offset
+            return _to_array(img_scaled), x_offset, y_offset
 
         # For flat mode: skip perspective distortion, just use scaled image
         # Calculate position to ensure consistent overlap between images
@@ -145,165 +407,127 @@ class ImageTransformer:
                     x_offset = int((canvas_width - new_w) / 2 - displacement)
 
             y_offset = int((canvas_height - new_h) / 2)
-            return img_scaled, x_offset, y_offset
-
-        # Calculate perspective distortion for far edge
-        # Far edge is smaller in BOTH dimensions (proportionally)
-        perspective_amount = abs_angle * perspective  # How much smaller the far edge is
-        h_inset = int(new_w * perspective_amount)  # Horizontal inset
-        v_inset = int(new_h * perspective_amount / 2)  # Vertical inset (centered)
+            return _to_array(img_scaled), x_offset, y_offset
 
-        # Cache key for perspective matrix (based on dimensions and insets)
-        is_left = angle < 0
-        cache_key = (new_w, new_h, h_inset, v_inset, is_left)
-
-        # Thread-safe cache access for parallel motion blur rendering
-        with ImageTransformer._perspective_cache_lock:
-            cached = ImageTransformer._perspective_cache.get(cache_key)
-
-        if cached is not None:
-            matrix = cached
-        else:
-            # Source points (original rectangle)
-            pts1 = np.float32([
-                [0, 0],           # top-left
-                [new_w, 0],       # top-right
-                [0, new_h],       # bottom-left
-                [new_w, new_h]    # bottom-right
-            ])
-
-            if is_left:  # Left side - left edge is far (smaller)
-                pts2 = np.float32([
-                    [h_inset, v_inset],              # top-left: moves right and down
-                    [new_w, 0],                       # top-right: stays
-                    [h_inset, new_h - v_inset],      # bottom-left: moves right and up
-                    [new_w, new_h]                    # bottom-right: stays
-                ])
-            else:  # Right side - right edge is far (smaller)
-                pts2 = np.float32([
-                    [0, 0],                           # top-left: stays
-                    [new_w - h_inset, v_inset],       # top-right: moves left and down
-                    [0, new_h],                       # bottom-left: stays
-                    [new_w - h_inset, new_h - v_inset]  # bottom-right: moves left and up
-                ])
-
-            # Compute and cache perspective transform matrix (thread-safe write)
-            matrix = cv2.getPerspectiveTransform(pts1, pts2)
-            with ImageTransformer._perspective_cache_lock:
-                ImageTransformer._perspective_cache[cache_key] = matrix
-
-        # Apply transform
-        transformed = cv2.warpPerspective(
-            img_scaled, matrix, (new_w, new_h),
-            borderMode=cv2.BORDER_CONSTANT,
-            borderValue=(0, 0, 0, 0)
+        transformed = ImageTransformer._warp_scaled(
+            img_scaled, new_w, new_h, abs_angle * perspective, is_left=angle < 0,
+            interpolation=warp_interpolation, src_size=(new_w, new_h)
         )
 
         # Calculate position on canvas (arc mode - use position_scale for consistent spacing)
-        x_offset = int((canvas_width - new_w) / 2 + angle * canvas_width * spacing * position_scale)
+        x_offset = ImageTransformer.arc_x_offset(angle, new_w, canvas_width, spacing, position_scale)
         y_offset = int((canvas_height - new_h) / 2)
 
-        return transformed, x_offset, y_offset
+        return _to_array(transformed), x_offset, y_offset
 
-    def create_reflection(
-        self,
-        img: np.ndarray,
-        position: float,
-        canvas_width: int,
-        canvas_height: int,
-        alpha: float = 0.3,
-        perspective: float = 0.3,
-        side_scale: float = 0.3,
-        spacing: float = 0.35,
-        mode: str = "arc",
-        reflection_length: float = 0.5,
-        side_blur: float = 0.0,
-        side_alpha: float = 1.0,
-        side_scale_curve: str = "exponential",
-        side_blur_curve: str = "linear",
-        side_alpha_curve: str = "exponential",
-        side_scale_start: int = 1,
-        side_blur_start: int = 1,
-        side_alpha_start: int = 1,
-    ) -> Tuple[Optional[np.ndarray], int, int]:
-        """Create a reflection effect below the image.
+    @staticmethod
+    def box_blur(img: np.ndarray, ksize: int, sigma: float) -> np.ndarray:
+        """Approximate cv2.GaussianBlur(img, (ksize, ksize), sigma) with box filters.
 
-        Applies perspective transform first, then flips vertically,
-        ensuring the reflection has identical perspective to the original.
+        Three box passes of width w have variance 3 * (w^2 - 1) / 12, so w is
+        chosen to match the variance of the (truncated) Gaussian kernel that
+        GaussianBlur would use. Box filter cost does not depend on w.
 
         Args:
-            img: Input image (BGR or BGRA).
-            position: Perspective position (-1.0 to 1.0).
-            canvas_width: Canvas width for perspective calculation.
-            canvas_height: Canvas height for perspective calculation.
-            alpha: Overall opacity of the reflection (0.0 to 1.0).
-            perspective: Amount of perspective distortion (0 = none, default: 0.3).
-            side_scale: How much side images shrink (0 = same size, default: 0.3).
-            spacing: Horizontal spacing between images (default: 0.35).
-            mode: Layout mode - 'arc' (circular) or 'flat' (straight row).
-            reflection_length: Fraction of image height to show in reflection (0.0-1.0).
-            side_blur: Blur amount for side images (0 = no blur, higher = more blur).
-            side_alpha: Opacity for side images (1.0 = fully visible, lower = fades).
-            side_scale_curve: Curve type for side_scale effect.
-            side_blur_curve: Curve type for side_blur effect.
-            side_alpha_curve: Curve type for side_alpha effect.
-            side_scale_start: Position where scale effect begins (1 = immediate).
-            side_blur_start: Position where blur effect begins (1 = immediate).
-            side_alpha_start: Position where alpha effect begins (1 = immediate).
+            img: Input image.
+            ksize: Gaussian kernel size (odd).
+            sigma: Gaussian standard deviation.
 
         Returns:
-            Tuple of (reflected image with gradient fade, x_offset, y_offset).
+            Blurred image.
         """
-        # Step 1: Apply perspective transform FIRST (normal mode)
-        transformed, x_offset, y_offset = self.apply_perspective(
-            img, position, canvas_width, canvas_height, perspective, side_scale, spacing, mode,
-            side_blur, side_alpha, side_scale_curve, side_blur_curve, side_alpha_curve,
-            side_scale_start, side_blur_start, side_alpha_start
-        )
+        kernel = cv2.getGaussianKernel(ksize, sigma).ravel()
+        offsets = np.arange(ksize) - ksize // 2
+        variance = float(np.sum(kernel * offsets * offsets))
+        box = int(round(math.sqrt(4 * variance + 1))) | 1
+        for _ in range(3):
+            img = cv2.blur(img, (box, box))
+        return img
 
-        if transformed is None:
-            return None, 0, 0
+    @staticmethod
+    def arc_x_offset(
+        angle: float, new_w: int, canvas_width: int, spacing: float, position_scale: float
+    ) -> int:
+        """Get the canvas x position of a side image in arc mode.
 
-        # Step 2: THEN flip the perspectived image vertically
-        transformed = cv2.flip(transformed, 0)
+        Args:
+            angle: Position relative to center (0 = center).
+            new_w: Width of the transformed image.
+            canvas_width: Width of the target canvas.
+            spacing: Horizontal spacing between images.
+            position_scale: Exponential position scale (see get_position_params).
 
-        h, w = transformed.shape[:2]
+        Returns:
+            X offset of the image on the canvas.
+        """
+        return int((canvas_width - new_w) / 2 + angle * canvas_width * spacing * position_scale)
 
-        # Step 3: Crop to reflection_length (top portion of flipped = bottom of original)
-        crop_h = max(1, int(h * reflection_length))
-        transformed = transformed[:crop_h, :]
-        h = crop_h
+    @staticmethod
+    def perspective_insets(new_w: int, new_h: int, perspective_amount: float) -> Tuple[int, int]:
+        """Get the far-edge insets of a page rotated away from the viewer.
 
-        # Step 4: Apply gradient fade to alpha channel (broadcasting handles width)
-        gradient = np.linspace(1.0, 0, h, dtype=np.float32).reshape(-1, 1)
+        Args:
+            new_w: Page width.
+            new_h: Page height.
+            perspective_amount: How much smaller the far edge is (0 = none).
 
-        if transformed.shape[2] == 4:
-            # For BGRA: keep RGB intact, apply gradient to alpha only
-            rgb = transformed[:, :, :3]
-            alpha_channel = transformed[:, :, 3].astype(np.float32)
-            # Broadcasting: gradient (h,1) * alpha_channel (h,w) works automatically
-            alpha_channel = alpha_channel * gradient * alpha
-            transformed = np.dstack([rgb, alpha_channel.astype(np.uint8)])
-        else:
-            # For BGR: convert to BGRA and apply gradient to alpha
-            alpha_channel = (gradient * alpha * 255).astype(np.uint8)
-            # Broadcast to full width
-            alpha_channel = np.broadcast_to(alpha_channel, (h, w)).copy()
-            transformed = np.dstack([transformed, alpha_channel])
+        Returns:
+            Tuple of (horizontal inset, vertical inset at top and bottom).
+        """
+        # Far edge is smaller in BOTH dimensions (proportionally)
+        h_inset = int(new_w * perspective_amount)  # Horizontal inset
+        v_inset = int(new_h * perspective_amount / 2)  # Vertical inset (centered)
+        return h_inset, v_inset
+
+    @staticmethod
+    def _warp_scaled(
+        img: np.ndarray, new_w: int, new_h: int, perspective_amount: float, is_left: bool,
+        interpolation: int = cv2.INTER_LINEAR, src_size: Optional[Tuple[int, int]] = None
+    ) -> np.ndarray:
+        """Warp an image into a (new_w, new_h) page rotated away from the viewer.
 
-        return transformed, x_offset, y_offset
+        When img is not already new_w x new_h, the scale is composed into the
+        perspective matrix so resizing and warping happen in a single pass.
+
+        Args:
+            img: Input image (BGRA).
+            new_w: Output width.
+            new_h: Output height.
+            perspective_amount: How much smaller the far edge is (0 = none).
+            is_left: True if the left edge is the far edge.
+            interpolation: OpenCV interpolation flag for the warp.
+            src_size: (width, height) of img. Required when img is a cv2.UMat,
+                which does not expose its shape.
+
+        Returns:
+            Warped BGRA image (of the same type as img).
+        """
+        h_inset, v_inset = ImageTransformer.perspective_insets(new_w, new_h, perspective_amount)
+        matrix = ImageTransformer.get_perspective_matrix(new_w, new_h, h_inset, v_inset, is_left)
 
-    def create_reflection_from_transformed(
+        w, h = src_size if src_size is not None else (img.shape[1], img.shape[0])
+        if (w, h) != (new_w, new_h):
+            matrix = matrix @ np.diag([new_w / w, new_h / h, 1.0])
+
+        return cv2.warpPerspective(
+            img, matrix, (new_w, new_h),
+            flags=interpolation,
+            borderMode=cv2.BORDER_CONSTANT,
+            borderValue=(0, 0, 0, 0)
+        )
+
+    def create_reflection(
         self,
         transformed: np.ndarray,
         x_offset: int,
         alpha: float = 0.3,
         reflection_length: float = 0.5,
     ) -> Tuple[Optional[np.ndarray], int, int]:
-        """Create reflection from an already-transformed image (avoids duplicate transform).
+        """Create a reflection effect from an already-transformed image.
 
-        This is an optimization that skips the perspective transform since the input
-        image has already been transformed. Just flips, crops, and applies gradient.
+        Takes the output of apply_perspective, so the reflection has identical
+        perspective to the original without warping the image a second time.
+        Just crops, flips, and applies gradient.
 
         Args:
             transformed: Already perspective-transformed image (BGRA).
@@ -317,52 +541,41 @@ class ImageTransformer:
         if transformed is None:
             return None, 0, 0
 
-        # Step 1: Flip the perspectived image vertically
-        reflection = cv2.flip(transformed, 0)
-
-        h, w = reflection.shape[:2]
+        h = transformed.shape[0]
 
-        # Step 2: Crop to reflection_length (top portion of flipped = bottom of original)
+        # Step 1: Crop to reflection_length, then flip only those rows
+        # (top portion of flipped = bottom of original)
         crop_h = max(1, int(h * reflection_length))
-        reflection = reflection[:crop_h, :]
+        reflection = cv2.flip(transformed[h - crop_h:], 0)
         h = crop_h
 
-        # Step 3: Apply gradient fade to alpha channel (broadcasting handles width)
-        gradient = np.linspace(1.0, 0, h, dtype=np.float32).reshape(-1, 1)
+        # Step 2: Apply gradient fade to alpha channel (broadcasting handles width)
+        gradient = _reflection_gradient(h, alpha)
 
-        if reflection.shape[2] == 4:
-            # For BGRA: keep RGB intact, apply gradient to alpha only
-            rgb = reflection[:, :, :3]
-            alpha_channel = reflection[:, :, 3].astype(np.float32)
-            # Broadcasting: gradient (h,1) * alpha_channel (h,w) works automatically
-            alpha_channel = alpha_channel * gradient * alpha
-            reflection = np.dstack([rgb, alpha_channel.astype(np.uint8)])
-        else:
-            # For BGR: convert to BGRA and apply gradient to alpha
-            alpha_channel = (gradient * alpha * 255).astype(np.uint8)
-            # Broadcast to full width
-            alpha_channel = np.broadcast_to(alpha_channel, (h, w)).copy()
-            reflection = np.dstack([reflection, alpha_channel])
+        # Keep RGB intact, fade alpha in place (flip made a copy) in integer math
+        # Broadcasting: gradient (h,1) * alpha_channel (h,w) works automatically
+        reflection[:, :, 3] = (reflection[:, :, 3] * gradient + 127) // 255
 
         return reflection, x_offset, 0
 
     @staticmethod
-    def blend_onto_canvas(
+    def blend_into_canvas(
         canvas: np.ndarray, img: Optional[np.ndarray], x: int, y: int
-    ) -> np.ndarray:
-        """Blend an image onto the canvas at position (x, y) with alpha.
+    ) -> Optional[Tuple[int, int, int, int]]:
+        """Blend an image into the canvas at position (x, y) with alpha, in place.
 
         Args:
-            canvas: Target canvas.
-            img: Image to blend (may be None).
+            canvas: Target canvas (BGR), modified in place.
+            img: BGRA image to blend (may be None).
             x: X position on canvas.
             y: Y position on canvas.
 
         Returns:
-            Canvas with blended image.
+            Canvas rectangle (x1, y1, x2, y2) that was written, or None if
+            nothing was visible.
         """
         if img is None:
-            return canvas
+            return None
 
         h, w = img.shape[:2]
         canvas_h, canvas_w = canvas.shape[:2]
@@ -372,7 +585,7 @@ class ImageTransformer:
         x2, y2 = min(canvas_w, x + w), min(canvas_h, y + h)
 
         if x1 >= x2 or y1 >= y2:
-            return canvas
+            return None
 
         # Calculate source region
         src_x1 = x1 - x
@@ -380,14 +593,6 @@ class ImageTransformer:
         src_x2 = src_x1 + (x2 - x1)
         src_y2 = src_y1 + (y2 - y1)
 
-        # Handle alpha blending if image has alpha channel
-        if img.shape[2] == 4:
-            alpha = img[src_y1:src_y2, src_x1:src_x2, 3:4] / 255.0
-            rgb = img[src_y1:src_y2, src_x1:src_x2, :3]
-            canvas_region = canvas[y1:y2, x1:x2]
-            blended = (rgb * alpha + canvas_region * (1 - alpha)).astype(np.uint8)
-            canvas[y1:y2, x1:x2] = blended
-        else:
-            canvas[y1:y2, x1:x2] = img[src_y1:src_y2, src_x1:src_x2]
+        blend_bgra_over_bgr(canvas[y1:y2, x1:x2], img[src_y1:src_y2, src_x1:src_x2])
 
-        return canvas
+        return x1, y1, x2, y2
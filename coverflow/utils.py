@@ -187,6 +187,30 @@ INCREASE_CURVE_FUNCTIONS = {
 SIDE_CURVE_NAMES = ["quadratic", "exponential", "logarithmic", "sqrt", "linear"]
 
 
+def get_decay_curve(name: str) -> Callable[[float, float], float]:
+    """Get decay curve function by name.
+
+    Args:
+        name: Name of the curve function.
+
+    Returns:
+        The curve function. Defaults to decay_exponential if name not found.
+    """
+    return DECAY_CURVE_FUNCTIONS.get(name, decay_exponential)
+
+
+def get_increase_curve(name: str) -> Callable[[float, float], float]:
+    """Get increase curve function by name.
+
+    Args:
+        name: Name of the curve function.
+
+    Returns:
+        The curve function. Defaults to increase_linear if name not found.
+    """
+    return INCREASE_CURVE_FUNCTIONS.get(name, increase_linear)
+
+
 def apply_decay_curve(value: float, angle: float, curve_name: str) -> float:
     """Apply a decay curve (for scale/alpha - starts at 1.0 at center).
 
@@ -198,8 +222,7 @@ def apply_decay_curve(value: float, angle: float, curve_name: str) -> float:
     Returns:
         The calculated value (1.0 at center, decreasing outward).
     """
-    curve_func = DECAY_CURVE_FUNCTIONS.get(curve_name, decay_exponential)
-    return curve_func(value, angle)
+    return get_decay_curve(curve_name)(value, angle)
 
 
 def apply_increase_curve(value: float, angle: float, curve_name: str) -> float:
@@ -213,5 +236,4 @@ def apply_increase_curve(value: float, angle: float, curve_name: str) -> float:
     Returns:
         The calculated value (0 at center, increasing outward).
     """
-    curve_func = INCREASE_CURVE_FUNCTIONS.get(curve_name, increase_linear)
-    return curve_func(value, angle)
+    return get_increase_curve(curve_name)(value, angle)
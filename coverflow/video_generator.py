@@ -1,17 +1,18 @@
 """Video generation for coverflow effect."""
 
-import sys
 import threading
-from concurrent.futures import ThreadPoolExecutor
+import time
+from itertools import groupby
+from multiprocessing import cpu_count
 from queue import Queue, Empty
-from threading import Thread, Event
-from typing import Callable, List, Optional
+from threading import Thread
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 
 import cv2
-import imageio
 import numpy as np
 
 from .config import Config
+from .ffmpeg_writer import FFmpegWriter, quality_params, select_codec
 from .renderer import CoverflowRenderer
 from .utils import get_easing_function
 
@@ -29,9 +30,53 @@ class FrameBuffer:
         Args:
             max_size: Maximum number of frames to buffer (~1 second at 30fps).
         """
+        # Rendered frames, followed by None once rendering stops
         self.queue: Queue = Queue(maxsize=max_size)
-        self.done = Event()
         self.error: Optional[Exception] = None
+        # Preallocated frames handed out by acquire() and returned by the
+        # encoder through release() once written, instead of a fresh
+        # allocation per frame
+        self._free_slots: Queue = Queue()
+        self._slot_ids: set = set()
+        self._slot_shape: Optional[Tuple[int, ...]] = None
+
+    def allocate_slots(self, count: int, shape: Tuple[int, ...]) -> None:
+        """Preallocate frame slots for acquire().
+
+        Args:
+            count: Number of slots.
+            shape: Frame shape (height, width, 3).
+        """
+        self._slot_shape = shape
+        for _ in range(count):
+            slot = np.empty(shape, dtype=np.uint8)
+            self._slot_ids.add(id(slot))
+            self._free_slots.put(slot)
+
+    def acquire(self) -> np.ndarray:
+        """Get a free frame slot to render into, waiting for one if needed.
+
+        Returns:
+            Frame slot. Queue it once rendered; the encoder releases it.
+        """
+        while True:
+            try:
+                return self._free_slots.get(timeout=0.1)
+            except Empty:
+                # The encoder stopped and will not hand slots back
+                if self.error is not None:
+                    return np.empty(self._slot_shape, dtype=np.uint8)
+
+    def release(self, frame: np.ndarray) -> None:
+        """Return a written frame to the free slots.
+
+        Frames that are not slots (e.g. a repeated hold frame) are ignored.
+
+        Args:
+            frame: Frame that has been written to the video.
+        """
+        if id(frame) in self._slot_ids:
+            self._free_slots.put(frame)
 
 
 class VideoGenerator:
@@ -44,64 +89,147 @@ class VideoGenerator:
             config: Video generation configuration.
         """
         self.config = config
-        self.renderer = CoverflowRenderer(config)
+        # Created on first use, so statistics mode never loads the background
+        # or compiles the blend kernel
+        self._renderer: Optional[CoverflowRenderer] = None
         self.easing_func = get_easing_function(config.easing)
+        self._eased_offsets_cache: Dict[int, Tuple[float, ...]] = {}
+
+    @property
+    def renderer(self) -> CoverflowRenderer:
+        """Frame renderer, created on first access."""
+        if self._renderer is None:
+            # Render RGB frames, the order the encoder expects, so frames can
+            # be queued without a per-frame conversion
+            self._renderer = CoverflowRenderer(self.config, channel_order="rgb")
+        return self._renderer
+
+    def _eased_offsets(self, transition_frames: int) -> Tuple[float, ...]:
+        """Get the eased offset of every frame of a transition, computing them once.
+
+        Every transition has the same length, so the easing function only
+        runs for the first one.
+
+        Args:
+            transition_frames: Number of frames in a transition.
 
-    def _render_with_motion_blur(
+        Returns:
+            Offsets (0 to 1) indexed by frame number within the transition.
+        """
+        offsets = self._eased_offsets_cache.get(transition_frames)
+        if offsets is None:
+            offsets = tuple(
+                self.easing_func(frame / transition_frames) for frame in range(transition_frames)
+            )
+            self._eased_offsets_cache[transition_frames] = offsets
+        return offsets
+
+    @staticmethod
+    def _build_schedule(
+        num_images: int, first_hold_frames: int, hold_frames: int,
+        transition_frames: int, loop: bool
+    ) -> List[Tuple[int, Optional[int]]]:
+        """Lay out every frame of the video.
+
+        Each image is held (the first one for first_hold_frames), then
+        transitions to the next; with loop the last image transitions back
+        to the first.
+
+        Args:
+            num_images: Number of images.
+            first_hold_frames: Hold frames of the first image.
+            hold_frames: Hold frames of every other image.
+            transition_frames: Frames per transition.
+            loop: Add a transition from the last image back to the first.
+
+        Returns:
+            One (image index, transition frame) pair per video frame, where
+            the transition frame is None while the image is held.
+        """
+        schedule: List[Tuple[int, Optional[int]]] = []
+        for img_idx in range(num_images):
+            hold = first_hold_frames if img_idx == 0 else hold_frames
+            schedule.extend([(img_idx, None)] * hold)
+            if img_idx < num_images - 1:
+                schedule.extend((img_idx, frame) for frame in range(transition_frames))
+        if loop:
+            schedule.extend((num_images - 1, frame) for frame in range(transition_frames))
+        return schedule
+
+    def _render_transition(
         self,
         images: List[np.ndarray],
         img_idx: int,
-        base_offset: float,
-        step_size: float,
-    ) -> np.ndarray:
-        """Render a frame with motion blur by blending multiple sub-frames.
-
-        Uses parallel processing for >= 3 samples (thread pool overhead not worth it
-        for fewer samples). The perspective cache in transforms.py is thread-safe.
+        frames: Sequence[int],
+        transition_frames: int,
+        get_buffer: Optional[Callable[[], np.ndarray]] = None,
+        max_workers: Optional[int] = None,
+    ) -> Iterator[np.ndarray]:
+        """Render the given frames of one transition, in order.
+
+        Frames are rendered in parallel by the renderer's thread pool. With
+        motion blur, the sub-frames of all frames are rendered as one stream
+        and summed as they arrive, so sub-frames of consecutive frames render
+        concurrently and no sub-frame is kept once added.
 
         Args:
             images: List of images.
-            img_idx: Current center image index.
-            base_offset: Base offset for this frame (0 to 1).
-            step_size: Offset step between frames (1/transition_frames).
-
-        Returns:
-            Blended frame with motion blur.
+            img_idx: Index of the image the transition starts from.
+            frames: Frame numbers within the transition to render.
+            transition_frames: Total number of frames in the transition.
+            get_buffer: Called for the buffer to render each frame into
+                (see CoverflowRenderer.render_frames); frames are newly
+                allocated when omitted.
+            max_workers: Number of render threads for frames rendered into
+                get_buffer's buffers (default: CPU count).
+
+        Yields:
+            Rendered frames (RGB) in the order of frames.
         """
-        num_samples = self.config.motion_blur
+        # Offsets (0 to 1) from the easing function for smooth animation
+        eased_offsets = self._eased_offsets(transition_frames)
+        offsets = [eased_offsets[frame] for frame in frames]
 
+        num_samples = self.config.motion_blur
         if num_samples <= 0:
-            # No motion blur, render single frame
-            return self.renderer.render_frame(images, img_idx, base_offset)
-
-        # Threshold for parallel processing (thread overhead not worth it for few samples)
-        MIN_SAMPLES_FOR_PARALLEL = 3
-        MAX_WORKERS = 4  # Diminishing returns beyond 4 threads
-
-        def render_subframe(i: int) -> np.ndarray:
-            """Render a single sub-frame at the given sample index."""
-            sub_offset = min(base_offset + (i / num_samples) * step_size, 1.0)
-            return self.renderer.render_frame(images, img_idx, sub_offset)
-
-        if num_samples >= MIN_SAMPLES_FOR_PARALLEL:
-            # Parallel rendering for better performance
-            with ThreadPoolExecutor(max_workers=min(num_samples, MAX_WORKERS)) as executor:
-                sub_frames = list(executor.map(render_subframe, range(num_samples)))
-
-            # Stack and average
-            accumulated = np.sum(sub_frames, axis=0, dtype=np.float32)
-            return (accumulated / num_samples).astype(np.uint8)
-        else:
-            # Sequential fallback for few samples (avoids thread overhead)
-            accumulated = np.zeros(
-                (self.config.height, self.config.width, 3), dtype=np.float32
+            yield from self.renderer.render_frames(
+                images, [(img_idx, offset) for offset in offsets],
+                max_workers=max_workers, get_buffer=get_buffer
             )
+            return
 
-            for i in range(num_samples):
-                sub_frame = render_subframe(i)
-                np.add(accumulated, sub_frame, out=accumulated, casting='unsafe')
+        # Each frame blends num_samples sub-frames spread over one frame step
+        step_size = 1.0 / transition_frames if transition_frames > 0 else 0
+        sub_specs = [
+            (img_idx, min(offset + (i / num_samples) * step_size, 1.0))
+            for offset in offsets
+            for i in range(num_samples)
+        ]
+
+        # Sum in the narrowest integer type that cannot overflow, then take the
+        # floor of the mean (same result as a float average)
+        acc_dtype = np.uint16 if num_samples * 255 <= np.iinfo(np.uint16).max else np.uint32
+        accumulated = np.zeros((self.config.height, self.config.width, 3), dtype=acc_dtype)
+
+        # Sub-frames are added right away, so the renderer can reuse their buffers
+        sub_frames = self.renderer.render_frames(images, sub_specs, reuse_buffers=True)
+        try:
+            for n, sub_frame in enumerate(sub_frames, 1):
+                np.add(accumulated, sub_frame, out=accumulated)
+                if n % num_samples:
+                    continue
 
-            return (accumulated / num_samples).astype(np.uint8)
+                accumulated //= num_samples
+                if get_buffer is not None:
+                    frame = get_buffer()
+                    np.copyto(frame, accumulated, casting='unsafe')
+                else:
+                    frame = accumulated.astype(np.uint8)
+                accumulated.fill(0)
+                yield frame
+        finally:
+            # Stop rendering sub-frames if the consumer stopped early
+            sub_frames.close()
 
     def _encode_frames(
         self,
@@ -117,33 +245,49 @@ class VideoGenerator:
 
         Args:
             buffer: Frame buffer to read from.
-            writer: Video writer (imageio) to write frames to.
+            writer: Video writer (FFmpegWriter) to write frames to.
             progress_callback: Optional callback for progress updates.
             frames_to_render: Total number of frames for progress calculation.
         """
+        # Report progress every PROGRESS_FRAMES frames or PROGRESS_INTERVAL
+        # seconds, whichever comes first: callbacks may marshal to a GUI thread
+        PROGRESS_FRAMES = 16
+        PROGRESS_INTERVAL = 0.1
+
         frames_written = 0
+        reported_frames = 0
+        reported_time = time.monotonic()
         try:
             while True:
-                # Check if we're done and buffer is empty
-                if buffer.done.is_set() and buffer.queue.empty():
+                # Block until the next frame; None marks the end of rendering
+                frame = buffer.queue.get()
+                if frame is None:
                     break
 
-                try:
-                    # Get frame with timeout to allow checking done flag
-                    frame = buffer.queue.get(timeout=0.1)
-                    writer.append_data(frame)
-                    frames_written += 1
+                writer.append_data(frame)
+                buffer.release(frame)
+                frames_written += 1
 
-                    if progress_callback:
+                if progress_callback:
+                    now = time.monotonic()
+                    if (frames_written - reported_frames >= PROGRESS_FRAMES
+                            or now - reported_time >= PROGRESS_INTERVAL):
                         progress_callback(frames_written, frames_to_render)
+                        reported_frames = frames_written
+                        reported_time = now
 
-                except Empty:
-                    # No frame available, check if we should exit
-                    continue
+            # Always report the final count
+            if progress_callback and frames_written != reported_frames:
+                progress_callback(frames_written, frames_to_render)
 
         except Exception as e:
             # Store error for main thread to handle
             buffer.error = e
+            # Keep consuming until the end marker so the renderer never
+            # blocks on a full queue or waits for a frame slot
+            while frame is not None:
+                buffer.release(frame)
+                frame = buffer.queue.get()
 
     def generate(
         self,
@@ -157,6 +301,10 @@ class VideoGenerator:
             images: List of images to include in the video.
             progress_callback: Optional callback for progress updates (current, total).
             cancel_flag: Optional threading event to signal cancellation.
+
+        Raises:
+            RuntimeError: If the video file could not be created or encoding
+                failed.
         """
         # Calculate frame counts
         transition_frames = int(self.config.transition * self.config.fps)
@@ -164,15 +312,11 @@ class VideoGenerator:
         first_hold_frames = int((self.config.first_hold if self.config.first_hold is not None else self.config.hold) * self.config.fps)
         num_images = len(images)
 
-        # Calculate total frames: hold for each image + transitions between images
-        # First image may have different hold duration
-        if num_images > 1:
-            total_frames = first_hold_frames + (num_images - 1) * hold_frames + (num_images - 1) * transition_frames
-        else:
-            total_frames = first_hold_frames
-        # Add extra transition for loop (last to first)
-        if self.config.loop:
-            total_frames += transition_frames
+        # What every frame of the video shows
+        schedule = self._build_schedule(
+            num_images, first_hold_frames, hold_frames, transition_frames, self.config.loop
+        )
+        total_frames = len(schedule)
         total_duration = total_frames / self.config.fps
 
         # Calculate frame range for rendering
@@ -209,36 +353,15 @@ class VideoGenerator:
             target_frame = max(0, min(target_frame, total_frames - 1))
 
             # Find which image and offset for this frame
-            # First image segment has different hold duration
-            first_segment = first_hold_frames + transition_frames
-            regular_segment = hold_frames + transition_frames
-
-            if target_frame < first_segment:
-                # We're in the first image segment
-                img_idx = 0
-                frame_in_segment = target_frame
-                current_hold_frames = first_hold_frames
-            else:
-                # We're past the first segment
-                remaining = target_frame - first_segment
-                img_idx = 1 + remaining // regular_segment
-                frame_in_segment = remaining % regular_segment
-                current_hold_frames = hold_frames
-
-            # Clamp image index
-            img_idx = min(img_idx, num_images - 1)
-
-            if frame_in_segment < current_hold_frames:
+            img_idx, trans_frame = schedule[target_frame] if schedule else (0, None)
+            if trans_frame is None:
                 offset = 0  # In hold phase
             else:
-                # In transition phase
-                trans_frame = frame_in_segment - current_hold_frames
-                offset = trans_frame / transition_frames if transition_frames > 0 else 0
-                offset = self.easing_func(offset)
+                offset = self._eased_offsets(transition_frames)[trans_frame]
 
             # Render and save
             canvas = self.renderer.render_frame(images, img_idx, offset)
-            cv2.imwrite("preview.jpg", canvas)
+            cv2.imwrite("preview.jpg", cv2.cvtColor(canvas, cv2.COLOR_RGB2BGR))
             print(f"Preview saved to 'preview.jpg' (frame {target_frame}, image {img_idx + 1}/{num_images})")
             return
 
@@ -247,7 +370,11 @@ class VideoGenerator:
         self.renderer.prepare_images(images)
 
         # Build FFmpeg output parameters
-        output_params = ['-preset', self.config.preset, '-crf', str(self.config.crf)]
+        # Select codec based on encoder setting ('auto' probes hardware encoders)
+        codec = select_codec(self.config.encoder)
+        if self.config.encoder == 'auto':
+            print(f"Using encoder: {codec}")
+        output_params = quality_params(codec, self.config.preset, self.config.crf)
         if self.config.max_bitrate:
             bitrate_val = str(self.config.max_bitrate)
             # Skip if value is 0 (no limit)
@@ -262,23 +389,36 @@ class VideoGenerator:
                     bitrate_val += 'k'
                 output_params += ['-maxrate', bitrate_val, '-bufsize', bitrate_val]
 
-        # Select codec based on encoder setting
-        codec = 'libx264' if self.config.encoder == 'h264' else 'libx265'
-
-        # Initialize imageio video writer
+        # Pipe raw frames straight into ffmpeg
         try:
-            out = imageio.get_writer(
+            out = FFmpegWriter(
                 self.config.output,
+                self.config.width,
+                self.config.height,
                 fps=self.config.fps,
                 codec=codec,
                 output_params=output_params
             )
         except Exception as e:
-            print(f"Error: Could not create video file '{self.config.output}': {e}")
-            sys.exit(1)
+            raise RuntimeError(f"Could not create video file '{self.config.output}': {e}") from e
 
         # Create frame buffer for render/encode pipeline
         frame_buffer = FrameBuffer(max_size=30)
+        # Transition frames are rendered into recycled slots: one for every
+        # frame the renderer keeps in flight, plus a backlog for the encoder.
+        # No more than the frames to render or MAX_SLOT_BYTES of memory.
+        FRAME_SLOTS_AHEAD = 8
+        MAX_SLOT_BYTES = 1 << 30
+        frame_shape = (self.config.height, self.config.width, 3)
+        slot_count = min(
+            2 * cpu_count() + FRAME_SLOTS_AHEAD,
+            frames_to_render + 1,
+            max(2, MAX_SLOT_BYTES // int(np.prod(frame_shape))),
+        )
+        frame_buffer.allocate_slots(slot_count, frame_shape)
+        # render_frames keeps up to 2 * workers slots in flight and would
+        # deadlock waiting for a slot if the pool were any smaller
+        render_workers = max(1, min(cpu_count(), slot_count // 2))
 
         # Start encoder thread
         encoder_thread = Thread(
@@ -288,133 +428,60 @@ class VideoGenerator:
         )
         encoder_thread.start()
 
-        absolute_frame = 0  # Track position in full video
-        generation_complete = False
-
         if start_frame > 0 or end_frame < total_frames - 1:
             print(f"Generating video (frames {start_frame} - {end_frame})...")
         else:
             print("Generating video...")
 
-        for img_idx in range(num_images):
-            if generation_complete:
-                break
-
-            # Check for cancellation
-            if cancel_flag and cancel_flag.is_set():
-                frame_buffer.done.set()
-                encoder_thread.join(timeout=5.0)
-                out.close()
-                print("Video generation cancelled.")
-                return
-
-            # Hold phase - keep current image centered
-            # First image uses first_hold_frames, rest use hold_frames
-            current_hold_frames = first_hold_frames if img_idx == 0 else hold_frames
-            print(f"  Processing image {img_idx + 1}/{num_images} - hold phase")
-
-            # Cache the hold frame - render once, write multiple times
-            hold_frame_rgb = None
-
-            for frame in range(current_hold_frames):
+        # Walk the requested frames one segment (a hold or a transition) at a time
+        segments = groupby(
+            schedule[start_frame:end_frame + 1], key=lambda entry: (entry[0], entry[1] is None)
+        )
+        for (img_idx, holding), entries in segments:
+            if holding:
+                print(f"  Processing image {img_idx + 1}/{num_images} - hold phase")
+                # Render the hold frame once, then write it for every hold frame
+                hold_frame = self.renderer.render_frame(images, img_idx, 0)
+                rendered = (hold_frame for _ in entries)
+            else:
+                if img_idx == num_images - 1:
+                    print("  Processing loop transition (back to image 1)")
+                else:
+                    print(f"  Processing image {img_idx + 1}/{num_images} - transition phase")
+                rendered = self._render_transition(
+                    images, img_idx, [frame for _, frame in entries], transition_frames,
+                    get_buffer=frame_buffer.acquire, max_workers=render_workers
+                )
+
+            for canvas in rendered:
                 # Check for cancellation
                 if cancel_flag and cancel_flag.is_set():
-                    frame_buffer.done.set()
+                    rendered.close()
+                    frame_buffer.queue.put(None)
                     encoder_thread.join(timeout=5.0)
-                    out.close()
-                    print("Video generation cancelled.")
-                    return
-
-                # Only write frames within the specified range
-                if start_frame <= absolute_frame <= end_frame:
-                    # Render hold frame only once, then reuse
-                    if hold_frame_rgb is None:
-                        hold_frame_cache = self.renderer.render_frame(images, img_idx, 0)
-                        hold_frame_rgb = cv2.cvtColor(hold_frame_cache, cv2.COLOR_BGR2RGB)
-
-                    # Push frame to buffer (encoder thread handles writing)
-                    frame_buffer.queue.put(hold_frame_rgb)
-
-                absolute_frame += 1
-
-                # Stop if we've passed the end frame
-                if absolute_frame > end_frame:
-                    generation_complete = True
-                    break
-
-            if generation_complete:
-                break
-
-            # Transition phase - animate to next image
-            if img_idx < num_images - 1:
-                print(f"  Processing image {img_idx + 1}/{num_images} - transition phase")
-                step_size = 1.0 / transition_frames if transition_frames > 0 else 0
-                for frame in range(transition_frames):
-                    # Check for cancellation
-                    if cancel_flag and cancel_flag.is_set():
-                        frame_buffer.done.set()
-                        encoder_thread.join(timeout=5.0)
+                    try:
                         out.close()
-                        print("Video generation cancelled.")
-                        return
-
-                    # Only write frames within the specified range
-                    if start_frame <= absolute_frame <= end_frame:
-                        # Calculate offset (0 to 1)
-                        offset = frame / transition_frames
-                        # Use easing function for smooth animation
-                        offset = self.easing_func(offset)
-
-                        # Render with motion blur if enabled
-                        canvas = self._render_with_motion_blur(images, img_idx, offset, step_size)
-                        # Push frame to buffer (encoder thread handles writing)
-                        frame_buffer.queue.put(cv2.cvtColor(canvas, cv2.COLOR_BGR2RGB))
-
-                    absolute_frame += 1
-
-                    # Stop if we've passed the end frame
-                    if absolute_frame > end_frame:
-                        generation_complete = True
-                        break
-
-        # Loop transition - animate from last image back to first
-        if self.config.loop and not generation_complete:
-            print(f"  Processing loop transition (back to image 1)")
-            step_size = 1.0 / transition_frames if transition_frames > 0 else 0
-            for frame in range(transition_frames):
-                # Check for cancellation
-                if cancel_flag and cancel_flag.is_set():
-                    frame_buffer.done.set()
-                    encoder_thread.join(timeout=5.0)
-                    out.close()
+                    except RuntimeError:
+                        # The partial video is discarded anyway
+                        pass
                     print("Video generation cancelled.")
                     return
 
-                # Only write frames within the specified range
-                if start_frame <= absolute_frame <= end_frame:
-                    # Calculate offset (0 to 1)
-                    offset = frame / transition_frames
-                    # Use easing function for smooth animation
-                    offset = self.easing_func(offset)
-
-                    # Render with motion blur if enabled
-                    canvas = self._render_with_motion_blur(images, num_images - 1, offset, step_size)
-                    # Push frame to buffer (encoder thread handles writing)
-                    frame_buffer.queue.put(cv2.cvtColor(canvas, cv2.COLOR_BGR2RGB))
-
-                absolute_frame += 1
-
-                # Stop if we've passed the end frame
-                if absolute_frame > end_frame:
-                    break
+                # Push frame to buffer (encoder thread handles writing)
+                frame_buffer.queue.put(canvas)
 
         # Signal encoder thread that rendering is complete
-        frame_buffer.done.set()
+        frame_buffer.queue.put(None)
         encoder_thread.join(timeout=30.0)  # Wait for encoder to finish
 
         # Check for encoder errors
-        if frame_buffer.error:
-            print(f"Warning: Encoder error occurred: {frame_buffer.error}")
+        encoder_error = frame_buffer.error
+        try:
+            out.close()
+        except RuntimeError as e:
+            # ffmpeg's exit tells more than the broken pipe it left behind
+            encoder_error = e
+        if encoder_error is not None:
+            raise RuntimeError(f"Could not write video file '{self.config.output}': {encoder_error}")
 
-        out.close()
         print(f"Video saved to '{self.config.output}'")
@@ -87,7 +87,7 @@ class VideoFrame(ctk.CTkFrame):
         self.encoder_menu = ctk.CTkOptionMenu(
             encoder_frame,
             variable=self.encoder_var,
-            values=["h264", "h265"],
+            values=["h264", "h265", "auto"],
             width=120,
             font=get_font(),
             dropdown_font=get_font(),
@@ -31,6 +31,9 @@ DEFAULTS = {
     "side_scale_start": 1,
     "side_blur_start": 1,
     "side_alpha_start": 1,
+    "fast_blur": False,
+    "fast_warp": False,
+    "use_opencl": False,
     "visible_range": 3,
     "spacing": 0.35,
     "reflection": 0.2,
@@ -215,6 +218,30 @@ def parse_args():
         default=None,
         help="Position where alpha effect begins (1 = immediate, 2 = skip first position, default: 1)",
     )
+    parser.add_argument(
+        "--fast-blur",
+        type=parse_bool,
+        default=None,
+        nargs="?",
+        const=True,
+        help="Approximate side blur with fast box filters instead of a Gaussian (true/false)",
+    )
+    parser.add_argument(
+        "--fast-warp",
+        type=parse_bool,
+        default=None,
+        nargs="?",
+        const=True,
+        help="Use nearest-neighbor warping for heavily faded or blurred side images (true/false)",
+    )
+    parser.add_argument(
+        "--use-opencl",
+        type=parse_bool,
+        default=None,
+        nargs="?",
+        const=True,
+        help="Transform images on the GPU through OpenCV's OpenCL support if available (true/false)",
+    )
     parser.add_argument(
         "--visible-range",
         type=int,
@@ -308,9 +335,9 @@ def parse_args():
     parser.add_argument(
         "--encoder",
         type=str,
-        choices=["h264", "h265"],
+        choices=["h264", "h265", "auto"],
         default=None,
-        help="Video encoder (h264 or h265)",
+        help="Video encoder (h264, h265, or auto for hardware H.264 when available)",
     )
     parser.add_argument(
         "--crf",
@@ -387,6 +414,12 @@ def main():
     print(f"  Side scale: {settings['side_scale']} ({settings['side_scale_curve']}, start={settings['side_scale_start']})")
     print(f"  Side blur: {settings['side_blur']} ({settings['side_blur_curve']}, start={settings['side_blur_start']})")
     print(f"  Side alpha: {settings['side_alpha']} ({settings['side_alpha_curve']}, start={settings['side_alpha_start']})")
+    if settings["fast_blur"]:
+        print(f"  Fast blur: {settings['fast_blur']}")
+    if settings["fast_warp"]:
+        print(f"  Fast warp: {settings['fast_warp']}")
+    if settings["use_opencl"]:
+        print(f"  Use OpenCL: {settings['use_opencl']}")
     print(f"  Visible range: {settings['visible_range']}")
     print(f"  Spacing: {settings['spacing']}")
     print(f"  Reflection: {settings['reflection']}")
@@ -430,6 +463,9 @@ def main():
         side_scale_start=settings["side_scale_start"],
         side_blur_start=settings["side_blur_start"],
         side_alpha_start=settings["side_alpha_start"],
+        fast_blur=settings["fast_blur"],
+        fast_warp=settings["fast_warp"],
+        use_opencl=settings["use_opencl"],
         visible_range=settings["visible_range"],
         spacing=settings["spacing"],
         reflection=settings["reflection"],
@@ -462,7 +498,12 @@ def main():
         print(f"\r  Rendering frame {current} of {total} ({percent}%)    ", end="", flush=True)
 
     generator = VideoGenerator(config)
-    generator.generate(images, progress_callback=print_progress)
+    try:
+        generator.generate(images, progress_callback=print_progress)
+    except RuntimeError as e:
+        print()  # Newline after progress
+        print(f"Error: {e}")
+        sys.exit(1)
     print()  # Newline after progress
 
     print("Done!")